@@ -0,0 +1,233 @@
+"""Benchmark comparativo entre el motor embebido y PostgreSQL.
+
+Corre la misma carga en cada motor y en cada factor de escala: las
+soluciones de los ejercicios guiados, los snippets de los retos (cada uno en
+una transacción que se revierte) y una mezcla parametrizada de SELECT/UPDATE
+sobre datos generados, ejecutada con sentencias preparadas. Devuelve un diccionario serializable a JSON con las
+distribuciones de latencia, el throughput y el tamaño de los datos.
+
+La carga de datos y el tamaño se reportan igual en los dos motores: la
+carga es lo que cuesta generar e insertar las filas (en el motor embebido,
+lo que tardó construir la instantánea) y el tamaño es el de las tablas con
+sus índices. Lo que tarda cada paso en dejar el motor listo va aparte.
+"""
+
+import os
+import platform
+import random
+import time
+from datetime import datetime
+
+from contenido import EJERCICIOS_GUIADOS, RETOS
+from editor_sql import dividir_sentencias
+from instantaneas import leer_metadatos, motor_con_datos
+from motores import CIUDADES, contar_filas, tabla_escrita
+
+UMBRAL_P95_MS = 50.0
+ESCALAS_POR_DEFECTO = (1, 10, 100)
+
+CONSULTAS_PARAMETRIZADAS = {
+    'select_por_ciudad': (
+        "SELECT nombre, email FROM alumno WHERE ciudad = %s",
+        lambda aleatorio, conteo, n: (aleatorio.choice(CIUDADES),)
+    ),
+    'select_por_id': (
+        "SELECT nombre, email, ciudad FROM alumno WHERE alumno_id = %s",
+        lambda aleatorio, conteo, n: (aleatorio.randint(1, conteo['alumno']),)
+    ),
+    'inscritos_por_curso': (
+        "SELECT COUNT(*) FROM inscripcion WHERE curso_id = %s",
+        lambda aleatorio, conteo, n: (aleatorio.randint(1, conteo['curso']),)
+    ),
+    'update_email': (
+        "UPDATE alumno SET email = %s WHERE alumno_id = %s",
+        lambda aleatorio, conteo, n: (f"bench{n}@uni.edu", aleatorio.randint(1, conteo['alumno']))
+    ),
+}
+
+# Peso de cada consulta en la mezcla (70% lecturas, 30% escrituras)
+MEZCLA = {'select_por_ciudad': 2, 'select_por_id': 4, 'inscritos_por_curso': 1, 'update_email': 3}
+
+
+def _percentil(ordenadas, percentil):
+    if not ordenadas:
+        return 0.0
+    posicion = (len(ordenadas) - 1) * percentil / 100
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenadas) - 1)
+    return ordenadas[inferior] + (ordenadas[superior] - ordenadas[inferior]) * (posicion - inferior)
+
+
+def estadisticas_latencia(latencias_s):
+    """p50/p95/p99/máx/media en milisegundos y operaciones por segundo"""
+    ordenadas = sorted(s * 1000 for s in latencias_s)
+    total_s = sum(latencias_s)
+    return {
+        'n': len(ordenadas),
+        'p50_ms': round(_percentil(ordenadas, 50), 3),
+        'p95_ms': round(_percentil(ordenadas, 95), 3),
+        'p99_ms': round(_percentil(ordenadas, 99), 3),
+        'max_ms': round(ordenadas[-1], 3) if ordenadas else 0.0,
+        'media_ms': round(sum(ordenadas) / len(ordenadas), 3) if ordenadas else 0.0,
+        'ops_s': round(len(ordenadas) / total_s, 1) if total_s else 0.0,
+    }
+
+
+def carga_fija():
+    """[(nombre, categoría, sql)] con las soluciones guiadas y los retos"""
+    carga = [
+        (f"guiado_{i + 1}", 'guiado', ejercicio['solucion'])
+        for i, ejercicio in enumerate(EJERCICIOS_GUIADOS)
+    ]
+    carga += [(f"reto_{i + 1}", 'reto', reto['snippet']) for i, reto in enumerate(RETOS)]
+    return carga
+
+
+def tablas_escritas():
+    """Tablas que modifican la carga fija y la mezcla"""
+    sentencias = [sentencia for _, _, sql in carga_fija() for sentencia in dividir_sentencias(sql)]
+    sentencias += [CONSULTAS_PARAMETRIZADAS[nombre][0] for nombre in MEZCLA]
+    return sorted({tabla for tabla in map(tabla_escrita, sentencias) if tabla})
+
+
+def medir_carga_fija(motor, repeticiones):
+    operaciones = []
+    for nombre, categoria, sql in carga_fija():
+        latencias = []
+        for _ in range(repeticiones):
+            with motor.transaccion_revertida():
+                inicio = time.perf_counter()
+                motor.ejecutar(sql)
+                latencias.append(time.perf_counter() - inicio)
+        operaciones.append({'nombre': nombre, 'categoria': categoria, **estadisticas_latencia(latencias)})
+    return operaciones
+
+
+def medir_mezcla(motor, conteo, operaciones_totales, semilla):
+    """Mezcla parametrizada con la misma secuencia de consultas en cada motor"""
+    aleatorio = random.Random(semilla)
+    nombres = list(MEZCLA)
+    pesos = [MEZCLA[n] for n in nombres]
+    latencias = {nombre: [] for nombre in nombres}
+
+    inicio_total = time.perf_counter()
+    for n in range(operaciones_totales):
+        nombre = aleatorio.choices(nombres, pesos)[0]
+        sql, parametros = CONSULTAS_PARAMETRIZADAS[nombre]
+        valores = parametros(aleatorio, conteo, n)
+        inicio = time.perf_counter()
+        motor.ejecutar_preparada(sql, valores)
+        latencias[nombre].append(time.perf_counter() - inicio)
+    duracion_total = time.perf_counter() - inicio_total
+
+    operaciones = [
+        {'nombre': nombre, 'categoria': 'mezcla', **estadisticas_latencia(valores)}
+        for nombre, valores in latencias.items() if valores
+    ]
+    throughput = round(operaciones_totales / duracion_total, 1) if duracion_total else 0.0
+    return operaciones, throughput
+
+
+def _rss_actual_bytes():
+    """RSS actual del proceso (no el pico de toda su vida), o None fuera de Linux"""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def ejecutar_benchmark(motores=("embebido",), escalas=ESCALAS_POR_DEFECTO, repeticiones=20,
+                       operaciones_mezcla=1000, semilla=42, config_pg=None, al_progresar=None):
+    """Corre la carga en cada (motor, escala) y devuelve los resultados"""
+    resultados = []
+    pasos = [(motor, escala) for escala in escalas for motor in motores]
+
+    for paso, (nombre_motor, escala) in enumerate(pasos):
+        if al_progresar:
+            al_progresar(paso / len(pasos), f"{nombre_motor} · escala {escala}")
+
+        rss_inicial = _rss_actual_bytes()
+        inicio = time.perf_counter()
+        motor = motor_con_datos(nombre_motor, escala, semilla, config_pg=config_pg)
+        try:
+            # Las escrituras se miden en transacciones que se revierten: la
+            # copia desde la instantánea tiene que quedar hecha antes
+            motor.preparar_escritura(*tablas_escritas())
+            preparacion_s = time.perf_counter() - inicio
+            instantanea = getattr(motor, 'instantanea', None)
+            carga_s = float(leer_metadatos(instantanea)['construccion_s']) if instantanea else preparacion_s
+
+            conteo = contar_filas(escala)
+            operaciones = medir_carga_fija(motor, repeticiones)
+            mezcla, throughput = medir_mezcla(motor, conteo, operaciones_mezcla, semilla)
+            rss_final = _rss_actual_bytes()
+
+            resultados.append({
+                'motor': nombre_motor,
+                'escala': escala,
+                'filas': conteo,
+                'carga_s': round(carga_s, 3),
+                'preparacion_s': round(preparacion_s, 3),
+                'datos_bytes': motor.bytes_datos(),
+                # Memoria de cada lado: el RSS que ganó este proceso durante el paso
+                # (incluye SQLite, que corre dentro de él) y la del backend de PostgreSQL
+                'rss_cliente_delta_bytes': (
+                    rss_final - rss_inicial if rss_final is not None and rss_inicial is not None else None
+                ),
+                'memoria_servidor_bytes': motor.memoria_servidor(),
+                'mezcla_ops_s': throughput,
+                'cache_sentencias': motor.metricas_cache(),
+                'operaciones': operaciones + mezcla,
+            })
+        finally:
+            motor.cerrar()
+
+    if al_progresar:
+        al_progresar(1.0, "Terminado")
+
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'semilla': semilla,
+        'repeticiones': repeticiones,
+        'operaciones_mezcla': operaciones_mezcla,
+        'resultados': resultados,
+        'resumen': resumir(resultados),
+    }
+
+
+def resumir(resultados, umbral_p95_ms=UMBRAL_P95_MS):
+    """Por motor, la mayor escala antes de que alguna operación supere el umbral de p95"""
+    resumen = {'umbral_p95_ms': umbral_p95_ms, 'peor_p95_ms': {}, 'escala_maxima': {}}
+    superados = set()
+    for resultado in sorted(resultados, key=lambda r: r['escala']):
+        motor = resultado['motor']
+        peor = max(op['p95_ms'] for op in resultado['operaciones'])
+        resumen['peor_p95_ms'].setdefault(motor, {})[str(resultado['escala'])] = peor
+        resumen['escala_maxima'].setdefault(motor, None)
+        if peor > umbral_p95_ms:
+            superados.add(motor)
+        elif motor not in superados:
+            resumen['escala_maxima'][motor] = resultado['escala']
+    return resumen
+
+
+def tabla_resultados(resultados):
+    """Resultados aplanados en columnas para st.dataframe"""
+    tabla = {
+        "Motor": [], "Escala": [], "Operación": [], "Categoría": [], "p50 (ms)": [],
+        "p95 (ms)": [], "p99 (ms)": [], "Máx. (ms)": [], "Ops/s": []
+    }
+    for resultado in resultados['resultados']:
+        for op in resultado['operaciones']:
+            tabla["Motor"].append(resultado['motor'])
+            tabla["Escala"].append(resultado['escala'])
+            tabla["Operación"].append(op['nombre'])
+            tabla["Categoría"].append(op['categoria'])
+            tabla["p50 (ms)"].append(op['p50_ms'])
+            tabla["p95 (ms)"].append(op['p95_ms'])
+            tabla["p99 (ms)"].append(op['p99_ms'])
+            tabla["Máx. (ms)"].append(op['max_ms'])
+            tabla["Ops/s"].append(op['ops_s'])
+    return tabla
@@ -0,0 +1,113 @@
+"""Benchmark de arranque de app.py: tiempo de importación y de primer render.
+
+Cada medición se hace en un proceso nuevo para reproducir el arranque en frío
+de un pod. Termina con código 1 si se supera alguno de los presupuestos o si
+al arrancar se importa algún módulo que debería cargarse de forma diferida.
+
+Uso:
+    python benchmarks/bench_arranque.py [--repeticiones 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+PRESUPUESTO_IMPORTACION_S = 2.0
+PRESUPUESTO_PRIMER_RENDER_S = 1.0
+
+# Módulos que no deben importarse hasta que se seleccione la vista que los usa
+MODULOS_DIFERIDOS = [
+    "psycopg2",
+    "sqlite3",
+    "motores",
+    "benchmark_motores",
+    "laboratorio_concurrencia",
+    "laboratorio_particiones",
+    "instantaneas",
+    "contenido",
+    "editor_sql",
+    "estadisticas",
+    "similitud",
+    "vistas.contexto",
+    "vistas.ejercicios_guiados",
+    "vistas.practica_autonoma",
+    "vistas.cheatsheet",
+    "vistas.conexion",
+    "vistas.concurrencia",
+    "vistas.particiones",
+    "vistas.rendimiento",
+    "vistas.similitud",
+    "vistas.benchmark",
+]
+
+SCRIPT_IMPORTACION = """
+import json, sys, time
+inicio = time.perf_counter()
+import streamlit, estado, estilos, vistas
+fin = time.perf_counter()
+print(json.dumps({"segundos": fin - inicio, "modulos": sorted(sys.modules)}))
+"""
+
+SCRIPT_PRIMER_RENDER = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+inicio = time.perf_counter()
+app = AppTest.from_file("app.py", default_timeout=30).run()
+fin = time.perf_counter()
+print(json.dumps({
+    "segundos": fin - inicio,
+    "errores": [str(e.value) for e in app.exception],
+    "modulos": sorted(sys.modules),
+}))
+"""
+
+
+def medir(script):
+    resultado = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    importaciones = [medir(SCRIPT_IMPORTACION) for _ in range(args.repeticiones)]
+    renders = [medir(SCRIPT_PRIMER_RENDER) for _ in range(args.repeticiones)]
+
+    importacion_s = statistics.median(m["segundos"] for m in importaciones)
+    primer_render_s = statistics.median(m["segundos"] for m in renders)
+    cargados = set(importaciones[0]["modulos"]) | set(renders[0]["modulos"])
+
+    fallos = []
+    if importacion_s > PRESUPUESTO_IMPORTACION_S:
+        fallos.append(f"importación {importacion_s:.3f}s > {PRESUPUESTO_IMPORTACION_S}s")
+    if primer_render_s > PRESUPUESTO_PRIMER_RENDER_S:
+        fallos.append(f"primer render {primer_render_s:.3f}s > {PRESUPUESTO_PRIMER_RENDER_S}s")
+    for modulo in MODULOS_DIFERIDOS:
+        if modulo in cargados:
+            fallos.append(f"{modulo} se importa al arrancar")
+    for render in renders:
+        fallos.extend(f"error en el primer render: {error}" for error in render["errores"])
+
+    print(json.dumps({
+        "importacion_s": round(importacion_s, 4),
+        "primer_render_s": round(primer_render_s, 4),
+        "presupuesto_importacion_s": PRESUPUESTO_IMPORTACION_S,
+        "presupuesto_primer_render_s": PRESUPUESTO_PRIMER_RENDER_S,
+        "fallos": fallos,
+    }, indent=2, ensure_ascii=False))
+
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Benchmark comparativo entre el motor embebido (SQLite) y PostgreSQL.
+
+Corre la misma carga (soluciones guiadas, retos y mezcla parametrizada de
+SELECT/UPDATE) en cada motor y factor de escala, imprime una tabla con las
+latencias y guarda el resultado completo en JSON.
+
+Uso:
+    python benchmarks/bench_motores.py --escalas 1 10 100
+    PGPASSWORD=... python benchmarks/bench_motores.py --motores embebido postgres \\
+        --host localhost --bd universidad --usuario postgres
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from benchmark_motores import ESCALAS_POR_DEFECTO, UMBRAL_P95_MS, ejecutar_benchmark  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--motores", nargs="+", default=["embebido"], choices=["embebido", "postgres"])
+    parser.add_argument("--escalas", nargs="+", type=float, default=list(ESCALAS_POR_DEFECTO))
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--operaciones", type=int, default=1000, help="operaciones de la mezcla")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--puerto", default="5432")
+    parser.add_argument("--bd", default="universidad")
+    parser.add_argument("--usuario", default="postgres")
+    parser.add_argument("--salida", default="resultados_benchmark_motores.json")
+    args = parser.parse_args()
+
+    escalas = [int(e) if e.is_integer() else e for e in args.escalas]
+    config_pg = {'host': args.host, 'port': args.puerto, 'dbname': args.bd, 'user': args.usuario}
+
+    resultados = ejecutar_benchmark(
+        motores=args.motores, escalas=escalas, repeticiones=args.repeticiones,
+        operaciones_mezcla=args.operaciones, semilla=args.semilla, config_pg=config_pg,
+        al_progresar=lambda fraccion, mensaje: print(f"[{fraccion:4.0%}] {mensaje}", file=sys.stderr)
+    )
+
+    print(f"{'motor':10} {'escala':>7} {'operación':22} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>10}")
+    for resultado in resultados['resultados']:
+        for op in resultado['operaciones']:
+            print(
+                f"{resultado['motor']:10} {resultado['escala']:>7} {op['nombre']:22} "
+                f"{op['p50_ms']:>9.3f} {op['p95_ms']:>9.3f} {op['p99_ms']:>9.3f} {op['ops_s']:>10.1f}"
+            )
+
+    for resultado in resultados['resultados']:
+        cache = resultado['cache_sentencias']
+        print(
+            f"{resultado['motor']} escala {resultado['escala']}: caché de sentencias"
+            f"{' (estimada)' if cache.get('estimada') else ''} "
+            f"{cache['tasa_aciertos']:.1%} aciertos ({cache['aciertos']}/{cache['aciertos'] + cache['fallos']}), "
+            f"{cache['desalojos']} desalojos, {cache['reinicios']} reinicios"
+        )
+
+    resumen = resultados['resumen']
+    for motor, escala in resumen['escala_maxima'].items():
+        print(f"{motor}: mayor escala con p95 <= {UMBRAL_P95_MS} ms: {escala}")
+
+    Path(args.salida).write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"Resultados guardados en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
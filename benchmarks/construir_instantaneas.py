@@ -0,0 +1,49 @@
+"""Construye las instantáneas de datos para que los pods arranquen con ellas listas.
+
+Cada instantánea es un archivo SQLite por (esquema, escala, semilla) en
+TALLER_INSTANTANEAS_DIR. Conviene correrlo al construir la imagen o en un
+job de inicialización que escriba en un volumen compartido.
+
+Uso:
+    TALLER_INSTANTANEAS_DIR=/datos/instantaneas python benchmarks/construir_instantaneas.py --escalas 1 10 100 2000
+    python benchmarks/construir_instantaneas.py --listar
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from instantaneas import (  # noqa: E402
+    DIRECTORIO_INSTANTANEAS, MB, construir_instantanea, instantanea_valida, listar_instantaneas,
+    ruta_instantanea
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--escalas", nargs="+", type=float, default=[1, 10, 100])
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--forzar", action="store_true", help="reconstruye aunque ya exista")
+    parser.add_argument("--listar", action="store_true", help="solo lista las instantáneas existentes")
+    args = parser.parse_args()
+
+    if not args.listar:
+        for escala in [int(e) if e.is_integer() else e for e in args.escalas]:
+            existia = instantanea_valida(ruta_instantanea(escala, args.semilla), escala, args.semilla)
+            inicio = time.perf_counter()
+            ruta = construir_instantanea(escala, args.semilla, forzar=args.forzar)
+            estado = "ya existía y es válida" if existia and not args.forzar else f"construida en {time.perf_counter() - inicio:.1f} s"
+            print(f"escala {escala:g}: {ruta} ({estado})")
+
+    print(f"\nInstantáneas en {DIRECTORIO_INSTANTANEAS}:")
+    for ruta, tamano, metadatos in listar_instantaneas():
+        print(f"  {Path(ruta).name}  {tamano / MB:.1f} MB  escala {metadatos['escala']}  "
+              f"semilla {metadatos['semilla']}  creada {metadatos['creada']}")
+
+
+if __name__ == "__main__":
+    main()
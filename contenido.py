@@ -0,0 +1,114 @@
+"""Contenido del taller: scripts SQL, guía, ejercicios guiados y retos"""
+
+from recursos import leer_recurso
+
+SCHEMA_SQL = leer_recurso("schema.sql")
+
+SEED_SQL = leer_recurso("seed.sql")
+
+GUIA_PDF = leer_recurso("guia_taller_sql.txt")
+
+EJERCICIOS_GUIADOS = [
+    {
+        "titulo": "Ejercicio 1: INSERT de nuevos alumnos",
+        "enunciado": "Inserta dos nuevos alumnos en la tabla alumno: 'Carlos Mendoza' (carlos.mendoza@uni.edu, Cali) y 'María López' (maria.lopez@uni.edu, Medellín).",
+        "pista": "Usa INSERT INTO con VALUES para agregar múltiples registros. Recuerda que alumno_id es SERIAL y se genera automáticamente.",
+        "plantilla": """-- Inserta dos nuevos alumnos
+INSERT INTO alumno (nombre, email, ciudad) VALUES
+    -- Completa aquí""",
+        "solucion": """INSERT INTO alumno (nombre, email, ciudad) VALUES
+    ('Carlos Mendoza', 'carlos.mendoza@uni.edu', 'Cali'),
+    ('María López', 'maria.lopez@uni.edu', 'Medellín');"""
+    },
+    {
+        "titulo": "Ejercicio 2: UPDATE de email",
+        "enunciado": "Actualiza el email del alumno con alumno_id = 2 a 'luis.rios.nuevo@uni.edu'.",
+        "pista": "UPDATE requiere WHERE para especificar qué registro modificar. Sin WHERE, actualizarías TODOS los registros.",
+        "plantilla": """-- Actualiza el email de un alumno específico
+UPDATE alumno 
+SET -- Completa aquí
+WHERE -- Completa aquí""",
+        "solucion": """UPDATE alumno 
+SET email = 'luis.rios.nuevo@uni.edu'
+WHERE alumno_id = 2;"""
+    },
+    {
+        "titulo": "Ejercicio 3: DELETE de inscripción",
+        "enunciado": "Elimina la inscripción con inscripcion_id = 3.",
+        "pista": "DELETE FROM es directo, pero siempre usa WHERE para evitar eliminar todos los registros.",
+        "plantilla": """-- Elimina una inscripción específica
+DELETE FROM -- Completa aquí
+WHERE -- Completa aquí""",
+        "solucion": """DELETE FROM inscripcion
+WHERE inscripcion_id = 3;"""
+    },
+    {
+        "titulo": "Ejercicio 4: SELECT con filtro por ciudad",
+        "enunciado": "Selecciona el nombre y email de todos los alumnos que viven en 'Medellín'.",
+        "pista": "SELECT columnas FROM tabla WHERE condición. Las cadenas de texto van entre comillas simples.",
+        "plantilla": """-- Consulta alumnos de una ciudad específica
+SELECT -- Completa aquí
+FROM -- Completa aquí
+WHERE -- Completa aquí""",
+        "solucion": """SELECT nombre, email
+FROM alumno
+WHERE ciudad = 'Medellín';"""
+    },
+    {
+        "titulo": "Ejercicio 5: SELECT con rango de créditos",
+        "enunciado": "Selecciona todos los cursos que tienen entre 3 y 5 créditos.",
+        "pista": "Puedes usar BETWEEN o combinar condiciones con AND.",
+        "plantilla": """-- Consulta cursos por rango de créditos
+SELECT * FROM curso
+WHERE -- Completa aquí""",
+        "solucion": """SELECT * FROM curso
+WHERE creditos BETWEEN 3 AND 5;
+-- Alternativa:
+-- WHERE creditos >= 3 AND creditos <= 5;"""
+    }
+]
+
+RETOS = [
+    {
+        "titulo": "Agregar columna telefono",
+        "descripcion": "Usa ALTER TABLE para agregar una columna telefono a la tabla alumno",
+        "snippet": """-- Agregar columna telefono a tabla alumno
+ALTER TABLE alumno 
+ADD COLUMN telefono VARCHAR(20);"""
+    },
+    {
+        "titulo": "INSERT masivo de cursos",
+        "descripcion": "Inserta 3 cursos nuevos de una sola vez",
+        "snippet": """-- INSERT masivo de 3 cursos
+INSERT INTO curso (nombre, creditos) VALUES
+    ('Cálculo I', 4),
+    ('Física I', 3),
+    ('Algoritmos', 5);"""
+    },
+    {
+        "titulo": "UPDATE en cascada",
+        "descripcion": "Cambia la ciudad de todos los alumnos de 'Bogotá' a 'Bogotá D.C.'",
+        "snippet": """-- UPDATE múltiple por condición
+UPDATE alumno 
+SET ciudad = 'Bogotá D.C.'
+WHERE ciudad = 'Bogotá';"""
+    },
+    {
+        "titulo": "DELETE por condición",
+        "descripcion": "Elimina todas las inscripciones anteriores a una fecha específica",
+        "snippet": """-- DELETE con condición de fecha
+DELETE FROM inscripcion
+WHERE fecha < '2025-01-15';"""
+    },
+    {
+        "titulo": "SELECT con alias",
+        "descripcion": "Consulta con alias y concatenación de nombre completo",
+        "snippet": """-- SELECT con alias y concatenación
+SELECT 
+    alumno_id AS "ID",
+    nombre || ' (' || ciudad || ')' AS "Nombre Completo y Ciudad",
+    email AS "Correo Electrónico"
+FROM alumno
+ORDER BY nombre;"""
+    }
+]
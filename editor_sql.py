@@ -0,0 +1,356 @@
+"""Utilidades para los editores SQL: validación, tokenizador, catálogo de nombres y etiquetas"""
+
+import hashlib
+import re
+
+import streamlit as st
+
+from contenido import SCHEMA_SQL
+
+
+def validar_sintaxis_sql(codigo):
+    """Validación básica de sintaxis SQL"""
+    codigo = codigo.strip().upper()
+    comandos_validos = ['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'CREATE', 'ALTER', 'DROP']
+    
+    if not codigo:
+        return False, "El código está vacío"
+    
+    primer_comando = codigo.split()[0] if codigo.split() else ""
+    if primer_comando in comandos_validos:
+        return True, f"Comando {primer_comando} detectado correctamente"
+    else:
+        return False, f"El código debe comenzar con un comando SQL válido"
+
+
+PALABRAS_CLAVE_SQL = [
+    'SELECT', 'FROM', 'WHERE', 'INSERT', 'INTO', 'VALUES', 'UPDATE', 'SET',
+    'DELETE', 'CREATE', 'TABLE', 'ALTER', 'ADD', 'COLUMN', 'DROP', 'AND', 'OR',
+    'NOT', 'NULL', 'IS', 'IN', 'LIKE', 'ILIKE', 'BETWEEN', 'ORDER', 'BY', 'ASC',
+    'DESC', 'LIMIT', 'OFFSET', 'AS', 'DISTINCT', 'JOIN', 'INNER', 'LEFT',
+    'RIGHT', 'ON', 'GROUP', 'HAVING', 'PRIMARY', 'KEY', 'FOREIGN', 'REFERENCES',
+    'UNIQUE', 'CHECK', 'DEFAULT', 'CONSTRAINT', 'IF', 'EXISTS', 'CASCADE',
+    'TRUE', 'FALSE', 'COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'LOWER', 'UPPER',
+    'COALESCE', 'NOW', 'CURRENT_DATE', 'RETURNING', 'CURRENT_TIMESTAMP',
+    'CASE', 'WHEN', 'THEN', 'ELSE', 'END', 'UNION', 'ALL', 'ANY', 'EXCEPT',
+    'INTERSECT', 'OUTER', 'FULL', 'CROSS', 'NATURAL', 'USING', 'WITH',
+    'RECURSIVE', 'TO', 'RENAME', 'TRUNCATE', 'BEGIN', 'COMMIT', 'ROLLBACK',
+    'INDEX', 'VIEW', 'CAST', 'EXTRACT', 'INTERVAL', 'YEAR', 'MONTH', 'DAY',
+    'HOUR', 'MINUTE', 'SECOND', 'DATE_PART', 'DATE_TRUNC', 'AGE', 'ROUND',
+    'LENGTH', 'CONCAT', 'SUBSTRING', 'TRIM', 'REPLACE', 'NULLS', 'FIRST',
+    'LAST', 'OVER', 'PARTITION', 'ROW_NUMBER', 'RANK', 'FILTER', 'EXPLAIN',
+    'ANALYZE', 'TYPE', 'FOR', 'OF', 'RESTRICT', 'CONFLICT', 'DO', 'NOTHING',
+    'TEMP', 'TEMPORARY', 'ONLY'
+]
+
+TIPOS_SQL = [
+    'SERIAL', 'INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'NUMERIC', 'DECIMAL',
+    'VARCHAR', 'CHAR', 'TEXT', 'DATE', 'TIMESTAMP', 'BOOLEAN', 'REAL',
+    'FLOAT', 'DOUBLE', 'PRECISION', 'TIME', 'UUID', 'JSON', 'JSONB'
+]
+
+PATRON_ETIQUETA = re.compile(r"/\* taller:(\S+) alumno:(\S+) \*/")
+
+PATRON_TOKEN_SQL = re.compile(r"""
+    (?P<comentario>--[^\n]*|/\*.*?(?:\*/|$))
+  | (?P<cadena>'(?:[^']|'')*'?)
+  | (?P<citado>"(?:[^"]|"")*"?)
+  | (?P<numero>\d+(?:\.\d+)?)
+  | (?P<palabra>[^\W\d]\w*)
+  | (?P<simbolo>\S)
+""", re.VERBOSE | re.DOTALL)
+
+
+class TrieNombres:
+    """Árbol de prefijos con los nombres del catálogo"""
+
+    def __init__(self):
+        self.raiz = {}
+
+    def insertar(self, nombre, categoria, detalle=""):
+        nodo = self.raiz
+        for letra in nombre.lower():
+            nodo = nodo.setdefault(letra, {})
+        entradas = nodo.setdefault('$', [])
+        if (nombre, categoria, detalle) not in entradas:
+            entradas.append((nombre, categoria, detalle))
+
+    def entradas(self, nombre):
+        nodo = self.raiz
+        for letra in nombre.lower():
+            if letra not in nodo:
+                return []
+            nodo = nodo[letra]
+        return nodo.get('$', [])
+
+    def contiene(self, nombre):
+        return bool(self.entradas(nombre))
+
+    def buscar_prefijo(self, prefijo, limite=8):
+        """Devuelve hasta `limite` entradas cuyo nombre empieza por `prefijo`"""
+        nodo = self.raiz
+        for letra in prefijo.lower():
+            if letra not in nodo:
+                return []
+            nodo = nodo[letra]
+
+        resultados = []
+        pendientes = [nodo]
+        while pendientes and len(resultados) < limite:
+            actual = pendientes.pop()
+            resultados.extend(actual.get('$', []))
+            pendientes.extend(actual[c] for c in sorted(actual, reverse=True) if c != '$')
+        return resultados[:limite]
+
+
+def tokenizar_sql(codigo):
+    """Divide el código en tokens (tipo, valor, inicio, fin), sin comentarios"""
+    tokens = []
+    for coincidencia in PATRON_TOKEN_SQL.finditer(codigo):
+        tipo = coincidencia.lastgroup
+        if tipo != 'comentario':
+            tokens.append((tipo, coincidencia.group(), coincidencia.start(), coincidencia.end()))
+    return tokens
+
+
+def _dividir_definiciones(cuerpo):
+    """Separa las definiciones de un CREATE TABLE por comas de primer nivel"""
+    partes, actual, nivel = [], "", 0
+    for caracter in cuerpo:
+        if caracter == '(':
+            nivel += 1
+        elif caracter == ')':
+            nivel -= 1
+        if caracter == ',' and nivel == 0:
+            partes.append(actual)
+            actual = ""
+        else:
+            actual += caracter
+    partes.append(actual)
+    return [p.strip() for p in partes if p.strip()]
+
+
+def extraer_catalogo(codigo_ddl):
+    """Extrae {tabla: [(columna, tipo)]} de los CREATE TABLE y ALTER TABLE ... ADD COLUMN"""
+    catalogo = {}
+    restricciones = ('PRIMARY', 'FOREIGN', 'UNIQUE', 'CHECK', 'CONSTRAINT')
+
+    for tabla, cuerpo in re.findall(
+        r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\((.*?)\)\s*;",
+        codigo_ddl, re.IGNORECASE | re.DOTALL
+    ):
+        columnas = catalogo.setdefault(tabla.lower(), [])
+        for definicion in _dividir_definiciones(cuerpo):
+            partes = definicion.split()
+            if len(partes) >= 2 and partes[0].upper() not in restricciones:
+                columnas.append((partes[0].lower(), partes[1].upper()))
+
+    for tabla, columna, tipo in re.findall(
+        r"ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:COLUMN\s+)?(\w+)\s+([\w()]+)",
+        codigo_ddl, re.IGNORECASE
+    ):
+        catalogo.setdefault(tabla.lower(), []).append((columna.lower(), tipo.upper()))
+
+    return catalogo
+
+
+def aplicar_ddl(catalogo, codigo_ddl):
+    """Catálogo resultante de aplicar, en orden, los CREATE, ADD COLUMN, DROP COLUMN y DROP TABLE"""
+    catalogo = {tabla: list(columnas) for tabla, columnas in catalogo.items()}
+    for sentencia in dividir_sentencias(codigo_ddl):
+        for tabla, columnas in extraer_catalogo(sentencia).items():
+            existentes = catalogo.setdefault(tabla, [])
+            existentes.extend(c for c in columnas if c[0] not in {e[0] for e in existentes})
+
+        for tabla, columna in re.findall(
+            r"ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(\w+)\s+DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?(\w+)",
+            sentencia, re.IGNORECASE
+        ):
+            if tabla.lower() in catalogo:
+                catalogo[tabla.lower()] = [c for c in catalogo[tabla.lower()] if c[0] != columna.lower()]
+
+        eliminadas = re.match(
+            r"\s*DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?([\w\s,]+?)\s*(?:CASCADE|RESTRICT)?\s*;?\s*$",
+            sentencia, re.IGNORECASE
+        )
+        if eliminadas:
+            for tabla in eliminadas.group(1).split(','):
+                catalogo.pop(tabla.strip().lower(), None)
+    return catalogo
+
+
+def nombres_catalogo(catalogo):
+    """Tablas y columnas de un catálogo, en minúsculas"""
+    return set(catalogo) | {columna for columnas in catalogo.values() for columna, _ in columnas}
+
+
+def agregar_catalogo_a_indice(indice, catalogo):
+    """Inserta en el trie las tablas y columnas de un catálogo"""
+    for tabla, columnas in catalogo.items():
+        indice.insertar(tabla, 'tabla')
+        for columna, tipo in columnas:
+            indice.insertar(columna, 'columna', f"{tabla}, {tipo}")
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_indice_catalogo(version_esquema):
+    """Construye el índice del esquema una sola vez por versión (hash del DDL)"""
+    indice = TrieNombres()
+    for palabra in PALABRAS_CLAVE_SQL:
+        indice.insertar(palabra, 'palabra clave')
+    for tipo in TIPOS_SQL:
+        indice.insertar(tipo, 'tipo')
+    agregar_catalogo_a_indice(indice, extraer_catalogo(SCHEMA_SQL))
+    return indice
+
+
+VERSION_ESQUEMA = hashlib.sha1(SCHEMA_SQL.encode('utf-8')).hexdigest()[:12]
+
+
+def indice_sesion():
+    """Índice de la sesión con el catálogo tal como quedó tras los DDL del sandbox"""
+    if 'catalogo_sesion' not in st.session_state:
+        st.session_state.catalogo_sesion = TrieNombres()
+    return st.session_state.catalogo_sesion
+
+
+def nombres_eliminados():
+    """Nombres del esquema base que la sesión borró con DROP TABLE o DROP COLUMN"""
+    return st.session_state.get('nombres_eliminados', frozenset())
+
+
+def registrar_ddl_sesion(codigo):
+    """Aplica un DDL válido al catálogo de la sesión y devuelve las tablas creadas o ampliadas"""
+    base = extraer_catalogo(SCHEMA_SQL)
+    catalogo = aplicar_ddl(st.session_state.get('catalogo_ddl_sesion', base), codigo)
+    st.session_state.catalogo_ddl_sesion = catalogo
+
+    # El catálogo de la sesión es pequeño: se reconstruye entero
+    indice = TrieNombres()
+    agregar_catalogo_a_indice(indice, catalogo)
+    st.session_state.catalogo_sesion = indice
+    st.session_state.nombres_eliminados = frozenset(nombres_catalogo(base) - nombres_catalogo(catalogo))
+    return extraer_catalogo(codigo)
+
+
+def _nombre_conocido(nombre, indices, eliminados=frozenset()):
+    return nombre.lower() not in eliminados and any(indice.contiene(nombre) for indice in indices)
+
+
+def sugerir_nombres(prefijo, indices, limite=5, eliminados=frozenset()):
+    """Sugerencias de nombres del catálogo para un prefijo, sin los `eliminados`"""
+    vistos, sugerencias = set(eliminados), []
+    for indice in indices:
+        for nombre, categoria, detalle in indice.buscar_prefijo(prefijo, limite * 2):
+            if nombre.lower() not in vistos:
+                vistos.add(nombre.lower())
+                sugerencias.append((nombre, categoria, detalle))
+    return sugerencias[:limite]
+
+
+def revisar_nombres(codigo, indices, eliminados=frozenset()):
+    """Devuelve [(nombre, sugerencias)] para los nombres que no están en el catálogo"""
+    tokens = [t for t in tokenizar_sql(codigo) if t[0] in ('palabra', 'citado', 'simbolo')]
+    conocidos = nombres_catalogo(extraer_catalogo(codigo))
+    # Lo que el mismo código borra existía al escribirlo
+    conocidos.update(
+        nombre.lower()
+        for nombre in re.findall(r"DROP\s+(?:TABLE|COLUMN)\s+(?:IF\s+EXISTS\s+)?(\w+)", codigo, re.IGNORECASE)
+    )
+
+    # Alias: "AS alias" o "FROM tabla alias"
+    for anterior, siguiente in zip(tokens, tokens[1:]):
+        if siguiente[0] != 'palabra':
+            continue
+        es_tabla = anterior[0] == 'palabra' and any(
+            categoria == 'tabla'
+            for indice in indices
+            for _, categoria, _ in indice.entradas(anterior[1])
+        )
+        if anterior[1].upper() == 'AS' or (
+            es_tabla and not _nombre_conocido(siguiente[1], indices, eliminados)
+        ):
+            conocidos.add(siguiente[1].lower())
+
+    desconocidos = []
+    for tipo, valor, _, _ in tokens:
+        nombre = valor.lower()
+        if tipo != 'palabra' or nombre in conocidos or _nombre_conocido(nombre, indices, eliminados):
+            continue
+        conocidos.add(nombre)
+        sugerencias = []
+        for largo in range(len(nombre), 1, -1):
+            sugerencias = sugerir_nombres(nombre[:largo], indices, limite=3, eliminados=eliminados)
+            if sugerencias:
+                break
+        desconocidos.append((valor, [s[0] for s in sugerencias]))
+    return desconocidos
+
+
+def palabra_en_curso(codigo):
+    """Última palabra del editor si el cursor quedó justo al final de ella"""
+    tokens = tokenizar_sql(codigo)
+    if tokens and tokens[-1][0] == 'palabra' and tokens[-1][3] == len(codigo):
+        return tokens[-1][1]
+    return ""
+
+
+def mostrar_asistente_nombres(codigo):
+    """Autocompletado y revisión de nombres bajo un editor SQL"""
+    indices = [obtener_indice_catalogo(VERSION_ESQUEMA), indice_sesion()]
+    eliminados = nombres_eliminados()
+
+    parcial = palabra_en_curso(codigo)
+    if parcial:
+        opciones = [
+            s for s in sugerir_nombres(parcial, indices, eliminados=eliminados)
+            if s[0].lower() != parcial.lower()
+        ]
+        if opciones:
+            st.caption(
+                f"Autocompletar `{parcial}`: " +
+                ", ".join(f"`{nombre}` ({detalle or categoria})" for nombre, categoria, detalle in opciones)
+            )
+
+    for nombre, sugerencias in revisar_nombres(codigo, indices, eliminados):
+        if nombre == parcial:
+            continue
+        mensaje = f"⚠️ `{nombre}` no existe en el esquema"
+        if sugerencias:
+            mensaje += " — ¿quisiste decir " + ", ".join(f"`{s}`" for s in sugerencias) + "?"
+        st.caption(mensaje)
+
+
+def identificador_alumno():
+    """Nombre del alumno normalizado para etiquetas y entregas"""
+    return re.sub(r'\W+', '_', st.session_state.get('alumno_nombre', '').strip().lower()) or 'anonimo'
+
+
+def dividir_sentencias(codigo):
+    """Separa el código en sentencias por ';' fuera de cadenas y comentarios"""
+    sentencias, inicio = [], 0
+    for tipo, valor, _, fin in tokenizar_sql(codigo):
+        if tipo == 'simbolo' and valor == ';':
+            sentencias.append(codigo[inicio:fin])
+            inicio = fin
+    if codigo[inicio:].strip():
+        sentencias.append(codigo[inicio:])
+    return sentencias
+
+
+def etiquetar_consulta(codigo, ejercicio):
+    """Inserta /* taller:<ejercicio> alumno:<nombre> */ tras el primer comando de cada sentencia.
+
+    Va dentro de la sentencia porque pg_stat_statements descarta los
+    comentarios que la preceden.
+    """
+    etiqueta = f"/* taller:{ejercicio} alumno:{identificador_alumno()} */"
+
+    etiquetado = []
+    for sentencia in dividir_sentencias(codigo):
+        palabras = [t for t in tokenizar_sql(sentencia) if t[0] == 'palabra']
+        if palabras:
+            fin = palabras[0][3]
+            sentencia = f"{sentencia[:fin]} {etiqueta}{sentencia[fin:]}"
+        etiquetado.append(sentencia)
+    return "".join(etiquetado)
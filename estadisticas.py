@@ -0,0 +1,98 @@
+"""Lectura y agregación de pg_stat_statements para la vista de Rendimiento"""
+
+import streamlit as st
+
+from editor_sql import PATRON_ETIQUETA
+
+INTERVALO_ESTADISTICAS_S = 30
+
+
+@st.cache_data(ttl=INTERVALO_ESTADISTICAS_S, show_spinner=False)
+def leer_estadisticas_pg(host, puerto, base_datos, usuario, password):
+    """Lee los contadores acumulados de las consultas etiquetadas (como mucho una vez por intervalo)"""
+    import psycopg2
+
+    conn = psycopg2.connect(
+        host=host, port=puerto, dbname=base_datos, user=usuario, password=password,
+        connect_timeout=5
+    )
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT s.queryid, s.userid, r.rolname, s.query, s.calls,
+                       s.total_exec_time, s.max_exec_time, s.rows,
+                       s.shared_blks_hit, s.shared_blks_read
+                FROM pg_stat_statements s
+                JOIN pg_roles r ON r.oid = s.userid
+                WHERE s.dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+                  AND s.query LIKE '%/* taller:%'
+            """)
+            columnas = [c.name for c in cursor.description]
+            return [dict(zip(columnas, fila)) for fila in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
+@st.cache_resource(show_spinner=False)
+def linea_base_estadisticas():
+    """Contadores al inicio del laboratorio, compartidos por todas las sesiones"""
+    return {}
+
+
+def calcular_deltas(filas, linea_base):
+    """Resta la línea base a los contadores acumulados de cada consulta"""
+    contadores = ('calls', 'total_exec_time', 'rows', 'shared_blks_hit', 'shared_blks_read')
+    deltas = []
+    for fila in filas:
+        base = linea_base.get((fila['queryid'], fila['userid']))
+        # Si el contador bajó, alguien ejecutó pg_stat_statements_reset()
+        if base is None or fila['calls'] < base['calls']:
+            base = dict.fromkeys(contadores, 0)
+        delta = dict(fila)
+        for contador in contadores:
+            delta[contador] = fila[contador] - base[contador]
+        if delta['calls'] > 0:
+            deltas.append(delta)
+    return deltas
+
+
+def agrupar_estadisticas(deltas, por_alumno=False):
+    """Agrupa los deltas por ejercicio y, si se pide, por alumno.
+
+    El ejercicio sale de la etiqueta y el alumno del rol que ejecutó la
+    consulta: pg_stat_statements guarda una entrada por (rol, sentencia
+    normalizada) con el texto de la primera ejecución, así que la etiqueta
+    solo identifica al ejercicio, y al alumno únicamente a través de su rol.
+    """
+    grupos = {}
+    for delta in deltas:
+        etiqueta = PATRON_ETIQUETA.search(delta['query'])
+        if not etiqueta:
+            continue
+        ejercicio = etiqueta.group(1)
+        clave = (ejercicio, delta['rolname']) if por_alumno else (ejercicio,)
+        grupo = grupos.setdefault(clave, {
+            'calls': 0, 'total_exec_time': 0.0, 'max_exec_time': 0.0,
+            'rows': 0, 'shared_blks_hit': 0, 'shared_blks_read': 0
+        })
+        for contador in ('calls', 'total_exec_time', 'rows', 'shared_blks_hit', 'shared_blks_read'):
+            grupo[contador] += delta[contador]
+        grupo['max_exec_time'] = max(grupo['max_exec_time'], delta['max_exec_time'])
+
+    tabla = {
+        "Ejercicio": [], "Llamadas": [], "Media (ms)": [], "Máx. (ms)": [],
+        "Filas": [], "Buffers hit": [], "Buffers leídos": []
+    }
+    if por_alumno:
+        tabla = {"Alumno (rol)": [], **tabla}
+    for clave, grupo in sorted(grupos.items(), key=lambda g: -g[1]['total_exec_time']):
+        tabla["Ejercicio"].append(clave[0])
+        if por_alumno:
+            tabla["Alumno (rol)"].append(clave[1])
+        tabla["Llamadas"].append(grupo['calls'])
+        tabla["Media (ms)"].append(round(grupo['total_exec_time'] / grupo['calls'], 2))
+        tabla["Máx. (ms)"].append(round(grupo['max_exec_time'], 2))
+        tabla["Filas"].append(grupo['rows'])
+        tabla["Buffers hit"].append(grupo['shared_blks_hit'])
+        tabla["Buffers leídos"].append(grupo['shared_blks_read'])
+    return tabla
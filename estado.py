@@ -0,0 +1,78 @@
+import re
+import uuid
+
+import streamlit as st
+
+TOTAL_GUIADOS = 5
+TOTAL_AUTONOMOS = 5
+
+
+def inicializar_estado():
+    if 'ejercicios_completados' not in st.session_state:
+        st.session_state.ejercicios_completados = 0
+    
+    if 'ejercicios_autonomos' not in st.session_state:
+        st.session_state.ejercicios_autonomos = 0
+    
+    if 'modo_docente' not in st.session_state:
+        st.session_state.modo_docente = False
+    
+    if 'objetivos_completados' not in st.session_state:
+        st.session_state.objetivos_completados = {
+            'lei_objetivos': False,
+            'complete_guiados': False,
+            'hice_autonomos': False
+        }
+    
+    if 'vista_actual' not in st.session_state:
+        st.session_state.vista_actual = "Inicio"
+    
+    if 'soluciones_reveladas' not in st.session_state:
+        st.session_state.soluciones_reveladas = 0
+    
+    if 'alumno_nombre' not in st.session_state:
+        st.session_state.alumno_nombre = ""
+    
+    if 'id_sesion' not in st.session_state:
+        # Se guarda en la URL para que recargar la página no cree otra sesión
+        id_sesion = st.query_params.get('sesion', '')
+        if not re.fullmatch(r'[0-9a-f]{8}', id_sesion):
+            id_sesion = uuid.uuid4().hex[:8]
+            st.query_params['sesion'] = id_sesion
+        st.session_state.id_sesion = id_sesion
+
+
+def config_postgres():
+    """Parámetros de conexión configurados en el sidebar"""
+    return {
+        'host': st.session_state.get('db_host', 'localhost'),
+        'port': st.session_state.get('db_puerto', '5432'),
+        'dbname': st.session_state.get('db_nombre', 'universidad'),
+        'user': st.session_state.get('db_usuario', 'postgres'),
+        'password': st.session_state.get('db_password', ''),
+    }
+
+
+def calcular_progreso():
+    """Calcula el progreso total del taller"""
+    total = TOTAL_GUIADOS + TOTAL_AUTONOMOS + \
+            len(st.session_state.objetivos_completados)
+    
+    completados = contar_bits(st.session_state.ejercicios_completados) + \
+                  contar_bits(st.session_state.ejercicios_autonomos) + \
+                  sum(st.session_state.objetivos_completados.values())
+    
+    return (completados / total * 100) if total > 0 else 0
+
+
+# Progreso por ejercicio guardado como bitset (un entero por lista)
+def bit_activo(bits, indice):
+    return bool(bits >> indice & 1)
+
+
+def marcar_bit(bits, indice, valor=True):
+    return bits | (1 << indice) if valor else bits & ~(1 << indice)
+
+
+def contar_bits(bits):
+    return bin(bits).count('1')
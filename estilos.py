@@ -0,0 +1,10 @@
+import streamlit as st
+
+from recursos import url_recurso
+
+
+def aplicar_estilos():
+    st.markdown(
+        f'<link rel="stylesheet" href="{url_recurso("estilos.css")}">',
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,175 @@
+"""Instantáneas de datos generados: un archivo SQLite por (esquema, escala, semilla).
+
+Generar millones de inscripciones en cada sesión o en cada arranque del pod
+es demasiado lento. Una instantánea se construye una vez (en segundo plano
+o con benchmarks/construir_instantaneas.py al preparar la imagen), se
+escribe en un archivo temporal y se publica con un rename atómico. Cada
+proceso la abre de solo lectura, inmutable y mapeada en memoria: las
+páginas viven en la caché del sistema operativo y se comparten entre todas
+las sesiones y todos los procesos del nodo. Las escrituras de cada sesión
+van a una capa copy-on-write propia (MotorEmbebido.montar_instantanea).
+
+El nombre del archivo lleva una huella del formato, del DDL, del código
+que genera y carga las filas y de las constantes que usa, así que cambiar
+cualquiera de ellos genera instantáneas nuevas en lugar de reutilizar datos
+viejos. Antes de usar una instantánea se comparan además sus metadatos con
+lo que se espera; si no coinciden se reconstruye.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+import motores
+from contenido import SCHEMA_SQL
+from motores import Motor, MotorEmbebido, contar_filas, crear_motor
+
+MB = 1024 * 1024
+VERSION_FORMATO = 2
+DIRECTORIO_INSTANTANEAS = os.environ.get(
+    "TALLER_INSTANTANEAS_DIR", os.path.join(tempfile.gettempdir(), "taller_instantaneas")
+)
+USAR_INSTANTANEAS = os.environ.get("TALLER_USAR_INSTANTANEAS", "1") != "0"
+MMAP_BYTES = int(float(os.environ.get("TALLER_MMAP_MB", "4096")) * MB)
+TABLA_METADATOS = "taller_instantanea"
+
+_construccion = threading.Lock()
+
+
+# Todo lo que decide qué filas quedan en la instantánea y cómo se guardan
+FUNCIONES_DATOS = (
+    motores.contar_filas, motores.generar_filas, motores._lotes,
+    Motor.crear_esquema, Motor.cargar_datos, MotorEmbebido._adaptar_ddl, MotorEmbebido._insertar_lote,
+)
+CONSTANTES_DATOS = (
+    'ALUMNOS_POR_ESCALA', 'CURSOS_POR_ESCALA', 'INSCRIPCIONES_POR_ESCALA', 'FECHA_INICIAL',
+    'DIAS_DE_INSCRIPCION', 'CIUDADES', 'NOMBRES', 'APELLIDOS', 'TAMANO_LOTE',
+)
+
+
+def huella_datos():
+    """Identifica el formato, el DDL, el código y las constantes con que se construyen los datos"""
+    contenido = [str(VERSION_FORMATO), SCHEMA_SQL]
+    contenido += [inspect.getsource(funcion) for funcion in FUNCIONES_DATOS]
+    contenido += [f"{nombre}={getattr(motores, nombre)!r}" for nombre in CONSTANTES_DATOS]
+    return hashlib.sha256("\n".join(contenido).encode("utf-8")).hexdigest()[:12]
+
+
+def ruta_instantanea(escala, semilla=42):
+    return os.path.join(DIRECTORIO_INSTANTANEAS, f"taller_{huella_datos()}_e{escala:g}_s{semilla}.sqlite3")
+
+
+def instantanea_valida(ruta, escala, semilla=42):
+    """True si el archivo existe y sus metadatos son los de (escala, semilla) con el formato actual"""
+    if not os.path.exists(ruta):
+        return False
+    try:
+        metadatos = leer_metadatos(ruta)
+        return (
+            metadatos.get('version') == str(VERSION_FORMATO)
+            and metadatos.get('huella') == huella_datos()
+            and float(metadatos.get('escala', 'nan')) == escala
+            and metadatos.get('semilla') == str(semilla)
+            and json.loads(metadatos.get('filas', 'null')) == contar_filas(escala)
+        )
+    except (sqlite3.DatabaseError, ValueError):
+        return False
+
+
+def construir_instantanea(escala, semilla=42, forzar=False):
+    """Ruta de la instantánea; la construye si todavía no existe o no es válida"""
+    ruta = ruta_instantanea(escala, semilla)
+    if not forzar and instantanea_valida(ruta, escala, semilla):
+        return ruta
+
+    os.makedirs(DIRECTORIO_INSTANTANEAS, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(prefix=".construyendo_", suffix=".sqlite3", dir=DIRECTORIO_INSTANTANEAS)
+    os.close(descriptor)
+    try:
+        motor = MotorEmbebido(temporal)
+        try:
+            # El archivo solo se publica si termina bien: no hace falta diario
+            motor.ejecutar("PRAGMA journal_mode = OFF")
+            motor.ejecutar("PRAGMA synchronous = OFF")
+            inicio = time.perf_counter()
+            motor.cargar_datos(escala, semilla)
+            metadatos = {
+                'version': VERSION_FORMATO,
+                'huella': huella_datos(),
+                'escala': escala,
+                'semilla': semilla,
+                'filas': json.dumps(contar_filas(escala)),
+                'construccion_s': round(time.perf_counter() - inicio, 3),
+                'creada': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+            motor.ejecutar(f"CREATE TABLE {TABLA_METADATOS} (clave TEXT PRIMARY KEY, valor TEXT)")
+            for clave, valor in metadatos.items():
+                motor.ejecutar(f"INSERT INTO {TABLA_METADATOS} VALUES (%s, %s)", (clave, str(valor)))
+        finally:
+            motor.cerrar()
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.remove(temporal)
+        raise
+    return ruta
+
+
+def instantanea_compartida(escala, semilla=42):
+    """Como construir_instantanea, pero una sola construcción a la vez por proceso"""
+    with _construccion:
+        return construir_instantanea(escala, semilla)
+
+
+def leer_metadatos(ruta):
+    motor = MotorEmbebido(f"file:{ruta}?mode=ro")
+    try:
+        _, filas = motor.ejecutar(f"SELECT clave, valor FROM {TABLA_METADATOS}")
+    finally:
+        motor.cerrar()
+    return dict(filas)
+
+
+def listar_instantaneas():
+    """[(ruta, bytes, metadatos)] de las instantáneas del directorio"""
+    if not os.path.isdir(DIRECTORIO_INSTANTANEAS):
+        return []
+    instantaneas = []
+    for nombre in sorted(os.listdir(DIRECTORIO_INSTANTANEAS)):
+        if nombre.startswith("taller_") and nombre.endswith(".sqlite3"):
+            ruta = os.path.join(DIRECTORIO_INSTANTANEAS, nombre)
+            instantaneas.append((ruta, os.path.getsize(ruta), leer_metadatos(ruta)))
+    return instantaneas
+
+
+def motor_con_datos(nombre, escala, semilla=42, config_pg=None, **opciones):
+    """Motor listo con los datos de (escala, semilla).
+
+    El motor embebido monta la instantánea compartida con una capa de
+    escritura en un archivo temporal propio; PostgreSQL los genera y carga.
+    """
+    if nombre == MotorEmbebido.nombre and USAR_INSTANTANEAS and not opciones:
+        motor = MotorEmbebido("")
+        motor.montar_instantanea(instantanea_compartida(escala, semilla), MMAP_BYTES)
+        return motor
+
+    motor = crear_motor(nombre, config_pg=config_pg, **opciones)
+    try:
+        motor.cargar_datos(escala, semilla)
+    except BaseException:
+        motor.cerrar()
+        raise
+    return motor
+
+
+def copiar_instantanea(escala, semilla, destino):
+    """Copia la instantánea a un archivo propio y escribible; False si están desactivadas"""
+    if not USAR_INSTANTANEAS:
+        return False
+    shutil.copyfile(instantanea_compartida(escala, semilla), destino)
+    return True
@@ -0,0 +1,320 @@
+"""Laboratorio de concurrencia: N clientes simulados en un pool de hilos.
+
+Cada cliente abre su propia conexión y ejecuta transacciones sobre alumno,
+curso e inscripcion: UPDATE de créditos de cursos, inscripciones que leen
+y luego escriben, y cambios de ciudad de dos alumnos en orden aleatorio (la
+receta clásica de un deadlock). Las operaciones se concentran en unas pocas
+filas "calientes" para provocar contención. La secuencia de operaciones de
+cada cliente sale de random.Random(semilla, cliente), por lo que es la
+misma en cada corrida; el entrelazado entre hilos depende del planificador.
+
+En PostgreSQL se usa el nivel de aislamiento elegido; los deadlocks (40P01)
+y fallos de serialización (40001) se cuentan y la transacción se reintenta.
+Las esperas por bloqueo se observan muestreando pg_stat_activity.
+
+Cada corrida usa su propio esquema y application_name, así que varias
+sesiones pueden correr el laboratorio contra el mismo servidor a la vez.
+
+SQLite (motor embebido) es siempre serializable y tiene un único bloqueo de
+escritura por base, así que no forma ciclos de deadlock. Con busy_timeout=0
+la sentencia que recibe SQLITE_BUSY se reintenta dentro de la transacción y
+cuenta como una espera por bloqueo, una vez por sentencia bloqueada. Si sigue
+bloqueada después de MAX_ESPERA_SENTENCIA_S la transacción se revierte y se
+reintenta entera: así termina también SQLITE_BUSY_SNAPSHOT (la instantánea WAL
+de la transacción quedó vieja), que reintentar la sentencia no resuelve y que
+antes de Python 3.11 no se distingue de un SQLITE_BUSY. Desde 3.11 se cuenta
+directamente como fallo de serialización.
+"""
+
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from instantaneas import copiar_instantanea
+from motores import CIUDADES, MotorEmbebido, MotorPostgres, contar_filas
+
+NIVELES_AISLAMIENTO = ["READ COMMITTED", "REPEATABLE READ", "SERIALIZABLE"]
+TIPOS_TRANSACCION = {'actualizar_curso': 3, 'inscribir': 4, 'mover_alumnos': 3}
+MAX_REINTENTOS = 10
+ESPERA_REINTENTO_S = 0.002
+MAX_ESPERA_SENTENCIA_S = 0.25
+INTERVALO_ACTUALIZACION_S = 0.25
+# Prefijos: cada corrida les agrega su propio identificador
+APLICACION_PG = "taller_lab"
+ESQUEMA_PG = "taller_lab"
+
+
+class Contadores:
+    """Contadores compartidos por los hilos de los clientes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.confirmadas = 0
+        self.esperas_bloqueo = 0
+        self.deadlocks = 0
+        self.fallos_serializacion = 0
+        self.abandonadas = 0
+        self.errores = []
+        self.latencias = []
+
+    def sumar(self, campo, cantidad=1):
+        with self._lock:
+            setattr(self, campo, getattr(self, campo) + cantidad)
+
+    def confirmar(self, latencia):
+        with self._lock:
+            self.confirmadas += 1
+            self.latencias.append(latencia)
+
+    def registrar_error(self, error):
+        with self._lock:
+            if len(self.errores) < 20:
+                self.errores.append(error)
+
+    def instantanea(self):
+        with self._lock:
+            return {
+                'confirmadas': self.confirmadas,
+                'esperas_bloqueo': self.esperas_bloqueo,
+                'deadlocks': self.deadlocks,
+                'fallos_serializacion': self.fallos_serializacion,
+                'abandonadas': self.abandonadas,
+                'errores': list(self.errores),
+                'latencias': list(self.latencias),
+            }
+
+
+def generar_transacciones(cliente, cantidad, semilla, filas_calientes, escala):
+    """Lista determinista de transacciones [(tipo, [(sql, parámetros)])] de un cliente"""
+    aleatorio = random.Random(f"{semilla}-{cliente}")
+    conteo = contar_filas(escala)
+    alumnos = min(filas_calientes, conteo['alumno'])
+    cursos = min(filas_calientes, conteo['curso'])
+    tipos = list(TIPOS_TRANSACCION)
+    pesos = [TIPOS_TRANSACCION[t] for t in tipos]
+
+    transacciones = []
+    for _ in range(cantidad):
+        tipo = aleatorio.choices(tipos, pesos)[0]
+        if tipo == 'actualizar_curso':
+            sentencias = [(
+                "UPDATE curso SET creditos = 7 - creditos WHERE curso_id = %s",
+                (aleatorio.randint(1, cursos),)
+            )]
+        elif tipo == 'inscribir':
+            curso = aleatorio.randint(1, cursos)
+            fecha = (date(2025, 1, 1) + timedelta(days=aleatorio.randrange(365))).isoformat()
+            sentencias = [
+                ("SELECT COUNT(*) FROM inscripcion WHERE curso_id = %s", (curso,)),
+                (
+                    "INSERT INTO inscripcion (alumno_id, curso_id, fecha) VALUES (%s, %s, %s)",
+                    (aleatorio.randint(1, alumnos), curso, fecha)
+                ),
+                ("UPDATE curso SET nombre = nombre WHERE curso_id = %s", (curso,)),
+            ]
+        else:
+            primero, segundo = aleatorio.sample(range(1, alumnos + 1), 2) if alumnos > 1 else (1, 1)
+            sentencias = [
+                ("UPDATE alumno SET ciudad = %s WHERE alumno_id = %s", (aleatorio.choice(CIUDADES), primero)),
+                ("UPDATE alumno SET ciudad = %s WHERE alumno_id = %s", (aleatorio.choice(CIUDADES), segundo)),
+            ]
+        transacciones.append((tipo, sentencias))
+    return transacciones
+
+
+def _clasificar_error(error):
+    """'espera', 'deadlock', 'serializacion' u 'otro'"""
+    codigo_pg = getattr(error, 'pgcode', None)
+    if codigo_pg == '40P01':
+        return 'deadlock'
+    if codigo_pg == '40001':
+        return 'serializacion'
+    if isinstance(error, sqlite3.OperationalError):
+        nombre = getattr(error, 'sqlite_errorname', '')
+        if nombre == 'SQLITE_BUSY_SNAPSHOT':
+            return 'serializacion'
+        if nombre.startswith('SQLITE_BUSY') or 'locked' in str(error):
+            return 'espera'
+    return 'otro'
+
+
+def _ejecutar_esperando(motor, sql, parametros, contadores, detener):
+    """Ejecuta una sentencia reintentándola mientras esté bloqueada, con un límite.
+
+    La espera se cuenta una sola vez por sentencia; al superar el límite se
+    relanza el error para que se reintente la transacción completa.
+    """
+    limite = None
+    while True:
+        try:
+            return motor.ejecutar(sql, parametros)
+        except Exception as error:
+            if _clasificar_error(error) != 'espera' or detener.is_set():
+                raise
+            if limite is None:
+                contadores.sumar('esperas_bloqueo')
+                limite = time.perf_counter() + MAX_ESPERA_SENTENCIA_S
+            elif time.perf_counter() > limite:
+                raise
+            time.sleep(ESPERA_REINTENTO_S)
+
+
+def _ejecutar_cliente(abrir_conexion, inicio_transaccion, transacciones, contadores, detener):
+    motor = abrir_conexion()
+    try:
+        for _, sentencias in transacciones:
+            if detener.is_set():
+                return
+            inicio = time.perf_counter()
+            for intento in range(MAX_REINTENTOS):
+                try:
+                    motor.ejecutar(inicio_transaccion)
+                    for sql, parametros in sentencias:
+                        _ejecutar_esperando(motor, sql, parametros, contadores, detener)
+                    _ejecutar_esperando(motor, "COMMIT", None, contadores, detener)
+                    contadores.confirmar(time.perf_counter() - inicio)
+                    break
+                except Exception as error:
+                    try:
+                        motor.ejecutar("ROLLBACK")
+                    except Exception:
+                        pass
+                    tipo = _clasificar_error(error)
+                    if tipo == 'deadlock':
+                        contadores.sumar('deadlocks')
+                    elif tipo == 'serializacion':
+                        contadores.sumar('fallos_serializacion')
+                    elif tipo == 'espera':
+                        # Ya contada por _ejecutar_esperando: solo se reintenta
+                        pass
+                    else:
+                        contadores.registrar_error(str(error).strip())
+                        contadores.sumar('abandonadas')
+                        break
+                    time.sleep(ESPERA_REINTENTO_S * (intento + 1))
+            else:
+                contadores.sumar('abandonadas')
+    finally:
+        motor.cerrar()
+
+
+def _esperas_pg(motor_admin, aplicacion):
+    """Claves (pid, inicio del estado) de los clientes de la corrida que esperan un bloqueo ahora"""
+    _, filas = motor_admin.ejecutar(
+        "SELECT pid, state_change FROM pg_stat_activity "
+        "WHERE application_name = %s AND wait_event_type = 'Lock'",
+        (aplicacion,)
+    )
+    return {tuple(fila) for fila in filas}
+
+
+def ejecutar_laboratorio(motor="embebido", clientes=8, transacciones_por_cliente=50,
+                         aislamiento="READ COMMITTED", filas_calientes=5, escala=1,
+                         semilla=42, config_pg=None, al_actualizar=None):
+    """Corre la simulación y devuelve las métricas finales.
+
+    `al_actualizar(metricas)` se llama desde el hilo que invoca la función cada
+    INTERVALO_ACTUALIZACION_S segundos mientras los clientes trabajan.
+    """
+    if aislamiento not in NIVELES_AISLAMIENTO:
+        raise ValueError(f"Nivel de aislamiento desconocido: {aislamiento}")
+
+    directorio = None
+    if motor == "embebido":
+        directorio = tempfile.mkdtemp(prefix="taller_lab_")
+        ruta = os.path.join(directorio, "laboratorio.sqlite3")
+        # Todos los clientes escriben en el mismo archivo: se parte de una copia
+        # de la instantánea en lugar de generar los datos
+        datos_copiados = copiar_instantanea(escala, semilla, ruta)
+        motor_admin = MotorEmbebido(ruta)
+        motor_admin.ejecutar("PRAGMA journal_mode = WAL")
+        inicio_transaccion = "BEGIN"
+
+        def abrir_conexion():
+            cliente = MotorEmbebido(ruta)
+            cliente.ejecutar("PRAGMA busy_timeout = 0")
+            return cliente
+    else:
+        datos_copiados = False
+        corrida = uuid.uuid4().hex[:12]
+        esquema = f"{ESQUEMA_PG}_{corrida}"
+        aplicacion = f"{APLICACION_PG}_{corrida}"
+        motor_admin = MotorPostgres(config_pg or {}, esquema=esquema)
+        inicio_transaccion = f"BEGIN ISOLATION LEVEL {aislamiento}"
+
+        def abrir_conexion():
+            cliente = MotorPostgres(config_pg or {}, esquema=esquema, borrar_al_cerrar=False)
+            cliente.ejecutar(f"SET application_name = '{aplicacion}'")
+            cliente.ejecutar("SET statement_timeout = '30s'")
+            return cliente
+
+    contadores = Contadores()
+    detener = threading.Event()
+    esperas_observadas = set()
+    esperando_ahora = 0
+
+    try:
+        if not datos_copiados:
+            motor_admin.cargar_datos(escala, semilla)
+        planes = [
+            generar_transacciones(cliente, transacciones_por_cliente, semilla, filas_calientes, escala)
+            for cliente in range(clientes)
+        ]
+
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clientes, thread_name_prefix="cliente") as pool:
+            futuros = [
+                pool.submit(_ejecutar_cliente, abrir_conexion, inicio_transaccion, plan, contadores, detener)
+                for plan in planes
+            ]
+            try:
+                while not all(f.done() for f in futuros):
+                    time.sleep(INTERVALO_ACTUALIZACION_S)
+                    if motor == "postgres":
+                        actuales = _esperas_pg(motor_admin, aplicacion)
+                        esperando_ahora = len(actuales)
+                        esperas_observadas |= actuales
+                    if al_actualizar:
+                        al_actualizar(_metricas(
+                            contadores, inicio, esperas_observadas, esperando_ahora, motor
+                        ))
+            except BaseException:
+                detener.set()
+                raise
+            for futuro in futuros:
+                futuro.result()
+
+        metricas = _metricas(contadores, inicio, esperas_observadas, 0, motor)
+        metricas.update({
+            'motor': motor, 'clientes': clientes, 'aislamiento': aislamiento,
+            'transacciones_por_cliente': transacciones_por_cliente,
+            'filas_calientes': filas_calientes, 'escala': escala, 'semilla': semilla,
+        })
+        return metricas
+    finally:
+        motor_admin.cerrar()
+        if directorio:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+
+def _metricas(contadores, inicio, esperas_observadas, esperando_ahora, motor):
+    datos = contadores.instantanea()
+    transcurrido = time.perf_counter() - inicio
+    latencias = sorted(datos.pop('latencias'))
+    if motor == "postgres":
+        datos['esperas_bloqueo'] = len(esperas_observadas)
+    datos.update({
+        'segundos': round(transcurrido, 3),
+        'throughput_tps': round(datos['confirmadas'] / transcurrido, 1) if transcurrido else 0.0,
+        'esperando_ahora': esperando_ahora,
+        'p50_ms': round(latencias[len(latencias) // 2] * 1000, 2) if latencias else 0.0,
+        'p95_ms': round(latencias[int(len(latencias) * 0.95)] * 1000, 2) if latencias else 0.0,
+    })
+    return datos
@@ -0,0 +1,243 @@
+"""Laboratorio de particionamiento por rango de inscripcion.fecha.
+
+Carga los datos generados en un motor y construye junto a la tabla plana
+una variante particionada por mes. Después corre sobre las dos la misma
+carga filtrada por fecha (los conteos y el DELETE del reto, siempre en una
+transacción que se revierte), guarda el plan de cada consulta y mide la
+latencia. También mide la alternativa de borrar particiones completas con
+DROP TABLE en lugar del DELETE masivo.
+
+En PostgreSQL la variante es una tabla declarativa (PARTITION BY RANGE) y
+es el planificador el que descarta particiones. SQLite no tiene
+particionamiento declarativo: el motor embebido usa una tabla por mes más
+una vista UNION ALL, y es el laboratorio el que elige qué tablas leer,
+igual que haría una aplicación que particiona a mano.
+"""
+
+import re
+import time
+import uuid
+from datetime import date, timedelta
+
+from benchmark_motores import estadisticas_latencia
+from editor_sql import dividir_sentencias
+from instantaneas import motor_con_datos
+from motores import DIAS_DE_INSCRIPCION, FECHA_INICIAL, contar_filas
+
+# Fecha del reto "DELETE por condición"
+FECHA_CORTE = "2025-01-15"
+TABLA_PARTICIONADA = "inscripcion_part"
+# Prefijo: cada corrida usa su propio esquema para no pisar a otras sesiones
+ESQUEMA_PG = "taller_part"
+PATRON_PARTICION = re.compile(rf'\b{TABLA_PARTICIONADA}_\d{{4}}_\d{{2}}\b')
+
+# nombre: (tipo, plantilla, desde, hasta); el rango es el que cubre el WHERE
+OPERACIONES = {
+    'contar_antes_corte': (
+        'lectura', f"SELECT COUNT(*) AS total FROM {{tabla}} WHERE fecha < '{FECHA_CORTE}'",
+        None, FECHA_CORTE
+    ),
+    'contar_un_mes': (
+        'lectura', "SELECT COUNT(*) AS total FROM {tabla} WHERE fecha >= '2025-03-01' AND fecha < '2025-04-01'",
+        '2025-03-01', '2025-04-01'
+    ),
+    'borrar_antes_corte': (
+        'borrado', f"DELETE FROM {{tabla}} WHERE fecha < '{FECHA_CORTE}'",
+        None, FECHA_CORTE
+    ),
+}
+
+
+def rangos_mensuales():
+    """[(partición, desde, hasta)] con un mes por partición; hasta es exclusivo"""
+    rangos = []
+    ultima_fecha = FECHA_INICIAL + timedelta(days=DIAS_DE_INSCRIPCION - 1)
+    desde = FECHA_INICIAL.replace(day=1)
+    while desde <= ultima_fecha:
+        hasta = date(desde.year + desde.month // 12, desde.month % 12 + 1, 1)
+        rangos.append((f"{TABLA_PARTICIONADA}_{desde:%Y_%m}", desde.isoformat(), hasta.isoformat()))
+        desde = hasta
+    return rangos
+
+
+def particiones_en_rango(desde=None, hasta=None):
+    """Particiones que pueden tener filas en [desde, hasta)"""
+    return [
+        nombre for nombre, inicio, fin in rangos_mensuales()
+        if (desde is None or fin > desde) and (hasta is None or inicio < hasta)
+    ]
+
+
+def borrar_particionada(motor):
+    if motor.nombre == "postgres":
+        motor.ejecutar(f"DROP TABLE IF EXISTS {TABLA_PARTICIONADA} CASCADE")
+        return
+    motor.ejecutar(f"DROP VIEW IF EXISTS {TABLA_PARTICIONADA}")
+    for nombre, _, _ in rangos_mensuales():
+        motor.ejecutar(f"DROP TABLE IF EXISTS {nombre}")
+
+
+def crear_particionada(motor, indice_fecha=False):
+    """Crea y llena la variante particionada a partir de inscripcion"""
+    rangos = rangos_mensuales()
+    borrar_particionada(motor)
+
+    if motor.nombre == "postgres":
+        motor.ejecutar(f"""
+            CREATE TABLE {TABLA_PARTICIONADA} (
+                inscripcion_id INT NOT NULL,
+                alumno_id INT NOT NULL REFERENCES alumno(alumno_id),
+                curso_id INT NOT NULL REFERENCES curso(curso_id),
+                fecha DATE NOT NULL,
+                PRIMARY KEY (inscripcion_id, fecha)
+            ) PARTITION BY RANGE (fecha)
+        """)
+        for nombre, desde, hasta in rangos:
+            motor.ejecutar(
+                f"CREATE TABLE {nombre} PARTITION OF {TABLA_PARTICIONADA} "
+                f"FOR VALUES FROM ('{desde}') TO ('{hasta}')"
+            )
+        motor.ejecutar(f"INSERT INTO {TABLA_PARTICIONADA} SELECT * FROM inscripcion")
+        if indice_fecha:
+            motor.ejecutar(f"CREATE INDEX idx_{TABLA_PARTICIONADA}_fecha ON {TABLA_PARTICIONADA} (fecha)")
+    else:
+        for nombre, desde, hasta in rangos:
+            motor.ejecutar(f"""
+                CREATE TABLE {nombre} (
+                    inscripcion_id INTEGER PRIMARY KEY,
+                    alumno_id INT NOT NULL REFERENCES alumno(alumno_id),
+                    curso_id INT NOT NULL REFERENCES curso(curso_id),
+                    fecha DATE NOT NULL CHECK (fecha >= '{desde}' AND fecha < '{hasta}')
+                )
+            """)
+            motor.ejecutar(
+                f"INSERT INTO {nombre} SELECT * FROM inscripcion WHERE fecha >= %s AND fecha < %s",
+                (desde, hasta)
+            )
+            if indice_fecha:
+                motor.ejecutar(f"CREATE INDEX idx_{nombre}_fecha ON {nombre} (fecha)")
+        motor.ejecutar(
+            f"CREATE VIEW {TABLA_PARTICIONADA} AS "
+            + " UNION ALL ".join(f"SELECT * FROM {nombre}" for nombre, _, _ in rangos)
+        )
+
+    if indice_fecha:
+        motor.ejecutar("CREATE INDEX idx_inscripcion_fecha ON inscripcion (fecha)")
+    motor.ejecutar("ANALYZE")
+
+
+def sql_operacion(motor, operacion, variante):
+    """SQL de una operación sobre la tabla plana o la particionada"""
+    tipo, plantilla, desde, hasta = OPERACIONES[operacion]
+    if variante == "plana":
+        return plantilla.format(tabla="inscripcion")
+    if motor.nombre == "postgres":
+        return plantilla.format(tabla=TABLA_PARTICIONADA)
+
+    # Particionado manual: solo se tocan las tablas que pueden tener filas
+    particiones = particiones_en_rango(desde, hasta)
+    if tipo == 'borrado':
+        return ";\n".join(plantilla.format(tabla=nombre) for nombre in particiones) + ";"
+    subconsultas = " UNION ALL ".join(plantilla.format(tabla=nombre) for nombre in particiones)
+    return f"SELECT SUM(total) AS total FROM ({subconsultas}) AS parciales"
+
+
+def sql_drop_particiones(corte=FECHA_CORTE):
+    """Alternativa al DELETE: DROP de los meses completos y DELETE solo en el mes del corte"""
+    sentencias = []
+    for nombre, desde, hasta in rangos_mensuales():
+        if hasta <= corte:
+            sentencias.append(f"DROP TABLE {nombre}")
+        elif desde < corte:
+            sentencias.append(f"DELETE FROM {nombre} WHERE fecha < '{corte}'")
+    return ";\n".join(sentencias) + ";"
+
+
+def plan_consulta(motor, sql):
+    """Líneas del plan de cada sentencia DML (las de DDL no tienen plan)"""
+    lineas = []
+    for sentencia in dividir_sentencias(sql):
+        sentencia = sentencia.strip().rstrip(';')
+        if not re.match(r'(SELECT|DELETE|UPDATE|INSERT)\b', sentencia, re.IGNORECASE):
+            continue
+        if motor.nombre == "postgres":
+            _, filas = motor.ejecutar(f"EXPLAIN (COSTS OFF) {sentencia}")
+            lineas += [fila[0] for fila in filas]
+        else:
+            _, filas = motor.ejecutar(f"EXPLAIN QUERY PLAN {sentencia}")
+            lineas += [fila[3] for fila in filas]
+    return lineas
+
+
+def particiones_leidas(plan):
+    """Particiones distintas que aparecen en el plan"""
+    return len({particion for linea in plan for particion in PATRON_PARTICION.findall(linea)})
+
+
+def medir(motor, sql, repeticiones):
+    latencias = []
+    for _ in range(repeticiones):
+        with motor.transaccion_revertida():
+            inicio = time.perf_counter()
+            motor.ejecutar(sql)
+            latencias.append(time.perf_counter() - inicio)
+    return estadisticas_latencia(latencias)
+
+
+def ejecutar_laboratorio(motor="embebido", escala=10, repeticiones=5, indice_fecha=False,
+                         semilla=42, config_pg=None, al_progresar=None):
+    """Construye las dos variantes, corre la carga en ambas y devuelve los resultados"""
+    opciones = {'esquema': f"{ESQUEMA_PG}_{uuid.uuid4().hex[:12]}"} if motor == "postgres" else {}
+    if al_progresar:
+        al_progresar(0.0, "Preparando datos")
+    inicio = time.perf_counter()
+    instancia = motor_con_datos(motor, escala, semilla, config_pg=config_pg, **opciones)
+    try:
+        instancia.preparar_escritura("inscripcion")
+        crear_particionada(instancia, indice_fecha)
+        carga_s = time.perf_counter() - inicio
+
+        pasos = [(operacion, variante) for operacion in OPERACIONES for variante in ("plana", "particionada")]
+        pasos.append(("drop_particiones", "particionada"))
+        operaciones = []
+        for paso, (operacion, variante) in enumerate(pasos):
+            if al_progresar:
+                al_progresar(0.1 + 0.9 * paso / len(pasos), f"{operacion} · {variante}")
+
+            if operacion == "drop_particiones":
+                sql = sql_drop_particiones()
+            else:
+                sql = sql_operacion(instancia, operacion, variante)
+            plan = plan_consulta(instancia, sql)
+
+            total = None
+            if operacion in OPERACIONES and OPERACIONES[operacion][0] == 'lectura':
+                _, filas = instancia.ejecutar(sql)
+                total = filas[0][0]
+
+            operaciones.append({
+                'operacion': operacion,
+                'variante': variante,
+                'sql': sql,
+                'plan': plan,
+                'particiones_leidas': particiones_leidas(plan) if variante == "particionada" else None,
+                'total': total,
+                **medir(instancia, sql, repeticiones),
+            })
+
+        if al_progresar:
+            al_progresar(1.0, "Terminado")
+    finally:
+        instancia.cerrar()
+
+    return {
+        'motor': motor,
+        'escala': escala,
+        'filas': contar_filas(escala)['inscripcion'],
+        'particiones': len(rangos_mensuales()),
+        'indice_fecha': indice_fecha,
+        'repeticiones': repeticiones,
+        'corte': FECHA_CORTE,
+        'carga_s': round(carga_s, 3),
+        'operaciones': operaciones,
+    }
@@ -0,0 +1,228 @@
+"""Contabilidad de memoria por sesión y caché de resultados con desalojo LRU.
+
+Los resultados grandes (tablas de resultados, planes, historiales) se guardan
+aquí y no en st.session_state. Cuando una sesión supera su presupuesto, sus
+entradas menos usadas se vuelcan a disco. Cuando el proceso supera el
+presupuesto global, se vuelcan las menos usadas de cualquier sesión. Las
+sesiones inactivas se purgan, así la memoria del réplica se mantiene estable
+durante todo el laboratorio.
+"""
+
+import atexit
+import itertools
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+
+MB = 1024 * 1024
+PRESUPUESTO_SESION_BYTES = int(float(os.environ.get("TALLER_MEMORIA_SESION_MB", "20")) * MB)
+PRESUPUESTO_GLOBAL_BYTES = int(float(os.environ.get("TALLER_MEMORIA_GLOBAL_MB", "512")) * MB)
+# En disco cada sesión puede ocupar hasta este múltiplo de su presupuesto en memoria
+FACTOR_DISCO = 4
+INACTIVIDAD_MAX_S = int(os.environ.get("TALLER_SESION_INACTIVA_MIN", "30")) * 60
+
+
+def tamano_profundo(objeto, vistos=None):
+    """Tamaño aproximado en bytes de un objeto y de todo lo que contiene"""
+    if vistos is None:
+        vistos = set()
+    if id(objeto) in vistos:
+        return 0
+    vistos.add(id(objeto))
+
+    tamano = sys.getsizeof(objeto)
+    if isinstance(objeto, dict):
+        tamano += sum(
+            tamano_profundo(k, vistos) + tamano_profundo(v, vistos) for k, v in objeto.items()
+        )
+    elif isinstance(objeto, (list, tuple, set, frozenset)):
+        tamano += sum(tamano_profundo(elemento, vistos) for elemento in objeto)
+    elif hasattr(objeto, '__dict__'):
+        tamano += tamano_profundo(vars(objeto), vistos)
+    return tamano
+
+
+class GestorMemoria:
+    """Caché de resultados por sesión con presupuestos por sesión y global"""
+
+    def __init__(self, presupuesto_sesion=PRESUPUESTO_SESION_BYTES,
+                 presupuesto_global=PRESUPUESTO_GLOBAL_BYTES, directorio=None):
+        self.presupuesto_sesion = presupuesto_sesion
+        self.presupuesto_global = presupuesto_global
+        if directorio is None:
+            # El directorio propio se borra al salir para no dejar pickles en /tmp
+            directorio = tempfile.mkdtemp(prefix="taller_sql_")
+            atexit.register(self.cerrar)
+        self.directorio = directorio
+        self._numeracion = itertools.count()
+        self._lock = threading.Lock()
+        # id_sesion -> OrderedDict(clave -> entrada), de menos a más reciente
+        self.sesiones = {}
+        self.huellas_estado = {}
+        self.ultimo_acceso = {}
+        self.bytes_memoria = 0
+        self.bytes_disco = 0
+
+    def guardar(self, id_sesion, clave, valor):
+        tamano = len(pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._purgar_inactivas()
+            entradas = self.sesiones.setdefault(id_sesion, OrderedDict())
+            if clave in entradas:
+                self._descartar(id_sesion, clave)
+            entradas[clave] = {'valor': valor, 'bytes': tamano, 'ruta': None}
+            self.bytes_memoria += tamano
+            self.ultimo_acceso[id_sesion] = time.time()
+            self._aplicar_presupuestos(id_sesion)
+
+    def obtener(self, id_sesion, clave, por_defecto=None):
+        with self._lock:
+            entradas = self.sesiones.get(id_sesion)
+            if not entradas or clave not in entradas:
+                return por_defecto
+            entradas.move_to_end(clave)
+            self.ultimo_acceso[id_sesion] = time.time()
+            entrada = entradas[clave]
+            if entrada['ruta'] is None:
+                return entrada['valor']
+            ruta = entrada['ruta']
+        # Se lee fuera del lock; si otra sesión purgó o desalojó la entrada
+        # mientras tanto, el archivo ya no existe y cuenta como fallo de caché
+        try:
+            with open(ruta, 'rb') as archivo:
+                return pickle.load(archivo)
+        except FileNotFoundError:
+            return por_defecto
+
+    def liberar_sesion(self, id_sesion):
+        with self._lock:
+            self._liberar(id_sesion)
+
+    def sesiones_activas(self):
+        """Sesiones que no se han purgado por inactividad"""
+        with self._lock:
+            self._purgar_inactivas()
+            return set(self.ultimo_acceso)
+
+    def registrar_huella_estado(self, id_sesion, bytes_estado):
+        with self._lock:
+            self._purgar_inactivas()
+            self.huellas_estado[id_sesion] = bytes_estado
+            self.ultimo_acceso[id_sesion] = time.time()
+
+    def resumen(self):
+        """Filas por sesión con su huella en st.session_state, en memoria y en disco"""
+        with self._lock:
+            filas = []
+            for id_sesion in set(self.sesiones) | set(self.huellas_estado):
+                entradas = self.sesiones.get(id_sesion, {}).values()
+                filas.append({
+                    'sesion': id_sesion,
+                    'estado': self.huellas_estado.get(id_sesion, 0),
+                    'memoria': sum(e['bytes'] for e in entradas if e['ruta'] is None),
+                    'disco': sum(e['bytes'] for e in entradas if e['ruta'] is not None),
+                    'entradas': len(entradas),
+                })
+            return sorted(filas, key=lambda f: -(f['estado'] + f['memoria']))
+
+    def _bytes_sesion(self, id_sesion, en_disco=False):
+        return sum(
+            e['bytes'] for e in self.sesiones.get(id_sesion, {}).values()
+            if (e['ruta'] is not None) == en_disco
+        )
+
+    def _aplicar_presupuestos(self, id_sesion):
+        entradas = self.sesiones[id_sesion]
+        for clave in list(entradas):
+            if self._bytes_sesion(id_sesion) <= self.presupuesto_sesion:
+                break
+            self._volcar(id_sesion, clave)
+
+        while self.bytes_memoria > self.presupuesto_global:
+            candidata = self._entrada_global_mas_antigua()
+            if candidata is None:
+                break
+            self._volcar(*candidata)
+
+        for clave in list(entradas):
+            if self._bytes_sesion(id_sesion, en_disco=True) <= self.presupuesto_sesion * FACTOR_DISCO:
+                break
+            if entradas[clave]['ruta'] is not None:
+                self._descartar(id_sesion, clave)
+
+    def _entrada_global_mas_antigua(self):
+        sesiones = sorted(self.sesiones, key=lambda s: self.ultimo_acceso.get(s, 0))
+        for id_sesion in sesiones:
+            for clave, entrada in self.sesiones[id_sesion].items():
+                if entrada['ruta'] is None:
+                    return id_sesion, clave
+        return None
+
+    def _volcar(self, id_sesion, clave):
+        entrada = self.sesiones[id_sesion][clave]
+        if entrada['ruta'] is not None:
+            return
+        ruta = os.path.join(self.directorio, f"{id_sesion}_{next(self._numeracion)}.pkl")
+        with open(ruta, 'wb') as archivo:
+            pickle.dump(entrada['valor'], archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        entrada['valor'] = None
+        entrada['ruta'] = ruta
+        self.bytes_memoria -= entrada['bytes']
+        self.bytes_disco += entrada['bytes']
+
+    def _descartar(self, id_sesion, clave):
+        entrada = self.sesiones[id_sesion].pop(clave)
+        if entrada['ruta'] is None:
+            self.bytes_memoria -= entrada['bytes']
+        else:
+            self.bytes_disco -= entrada['bytes']
+            try:
+                os.remove(entrada['ruta'])
+            except FileNotFoundError:
+                pass
+
+    def _liberar(self, id_sesion):
+        for clave in list(self.sesiones.get(id_sesion, ())):
+            self._descartar(id_sesion, clave)
+        self.sesiones.pop(id_sesion, None)
+        self.huellas_estado.pop(id_sesion, None)
+        self.ultimo_acceso.pop(id_sesion, None)
+
+    def _purgar_inactivas(self):
+        limite = time.time() - INACTIVIDAD_MAX_S
+        for id_sesion in [s for s, t in self.ultimo_acceso.items() if t < limite]:
+            self._liberar(id_sesion)
+
+    def cerrar(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+
+@st.cache_resource(show_spinner=False)
+def gestor_memoria():
+    return GestorMemoria()
+
+
+def guardar_resultado(clave, valor):
+    """Guarda un resultado grande de la sesión actual en la caché con presupuesto"""
+    gestor_memoria().guardar(st.session_state.id_sesion, clave, valor)
+
+
+def obtener_resultado(clave, por_defecto=None):
+    return gestor_memoria().obtener(st.session_state.id_sesion, clave, por_defecto)
+
+
+def medir_sesion():
+    """Mide la huella de st.session_state de la sesión actual y la registra"""
+    bytes_estado = sum(
+        tamano_profundo(clave) + tamano_profundo(st.session_state[clave])
+        for clave in list(st.session_state.keys())
+    )
+    gestor_memoria().registrar_huella_estado(st.session_state.id_sesion, bytes_estado)
+    return bytes_estado
@@ -0,0 +1,648 @@
+"""Motores de ejecución: SQLite embebido y PostgreSQL.
+
+Ambos exponen la misma interfaz (crear_esquema, cargar_datos, ejecutar,
+transaccion_revertida, bytes_datos, cerrar) para que los benchmarks y los
+laboratorios corran la misma carga en los dos. Las consultas usan %s como
+marcador de parámetros; el motor embebido lo traduce a ?.
+
+El motor embebido también puede montar una instantánea de solo lectura
+(ver instantaneas.py) con una capa copy-on-write por conexión.
+"""
+
+import random
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from urllib.parse import quote
+
+from contenido import SCHEMA_SQL
+from editor_sql import dividir_sentencias
+
+CIUDADES = ['Medellín', 'Bogotá', 'Cali', 'Barranquilla', 'Cartagena', 'Bucaramanga', 'Pereira', 'Manizales']
+NOMBRES = ['Ana', 'Luis', 'Sara', 'Carlos', 'María', 'Jorge', 'Laura', 'Andrés', 'Camila', 'Felipe']
+APELLIDOS = ['Gómez', 'Ríos', 'Díaz', 'Mendoza', 'López', 'Pérez', 'Castro', 'Vargas', 'Rojas', 'Torres']
+
+# Escala 1 = 1.000 alumnos, 50 cursos y 5.000 inscripciones
+ALUMNOS_POR_ESCALA = 1000
+CURSOS_POR_ESCALA = 50
+INSCRIPCIONES_POR_ESCALA = 5000
+FECHA_INICIAL = date(2024, 1, 1)
+DIAS_DE_INSCRIPCION = 730
+TAMANO_LOTE = 10000
+CAPACIDAD_SENTENCIAS = 64
+# Tamaño por defecto de la caché de sentencias compiladas de sqlite3
+CAPACIDAD_SENTENCIAS_SQLITE = 128
+ESQUEMA_INSTANTANEA = "base"
+
+# Primera tabla que modifica una sentencia (con los comentarios ya quitados)
+PATRON_ESCRITURA = re.compile(
+    r'^(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM'
+    r'|ALTER\s+TABLE|CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?\S+\s+ON'
+    r'|(DROP)\s+TABLE(?:\s+IF\s+EXISTS)?)\s+["`\[]?(\w+)',
+    re.IGNORECASE
+)
+PATRON_REFERENCIAS = re.compile(r'\bREFERENCES\s+["`\[]?(\w+)', re.IGNORECASE)
+# Claves foráneas de un CREATE TABLE, a nivel de columna o de tabla
+_DESTINO_FK = (
+    r'REFERENCES\s+["`\[]?\w+["`\]]?\s*(?:\([^)]*\))?'
+    r'(?:\s+ON\s+(?:DELETE|UPDATE)\s+(?:SET\s+NULL|SET\s+DEFAULT|CASCADE|RESTRICT|NO\s+ACTION))*'
+    r'(?:\s+(?:NOT\s+)?DEFERRABLE(?:\s+INITIALLY\s+(?:DEFERRED|IMMEDIATE))?)?'
+)
+PATRON_FK_TABLA = re.compile(r',\s*(?:CONSTRAINT\s+\S+\s+)?FOREIGN\s+KEY\s*\([^)]*\)\s*' + _DESTINO_FK, re.IGNORECASE)
+PATRON_FK_COLUMNA = re.compile(r'\s+(?:CONSTRAINT\s+\S+\s+)?' + _DESTINO_FK, re.IGNORECASE)
+PATRON_COMENTARIOS = re.compile(r'/\*.*?\*/|--[^\n]*', re.DOTALL)
+# Comienzo de cada CTE: nombre [(columnas)] AS [NOT] [MATERIALIZED] (
+PATRON_CTE = re.compile(
+    r'\s*["`\[]?\w+["`\]]?\s*(?:\([^)]*\)\s*)?AS\s*(?:NOT\s+)?(?:MATERIALIZED\s*)?\(', re.IGNORECASE
+)
+
+
+def contar_filas(escala):
+    return {
+        'alumno': int(ALUMNOS_POR_ESCALA * escala),
+        'curso': max(2, int(CURSOS_POR_ESCALA * escala)),
+        'inscripcion': int(INSCRIPCIONES_POR_ESCALA * escala),
+    }
+
+
+def generar_filas(escala, semilla=42):
+    """Filas deterministas por tabla: {tabla: (columnas, iterador de filas)}"""
+    conteo = contar_filas(escala)
+
+    def alumnos():
+        aleatorio = random.Random(semilla)
+        for i in range(1, conteo['alumno'] + 1):
+            nombre = f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}"
+            yield (nombre, f"alumno{i}@uni.edu", aleatorio.choice(CIUDADES))
+
+    def cursos():
+        aleatorio = random.Random(semilla + 1)
+        for i in range(1, conteo['curso'] + 1):
+            yield (f"Curso {i}", aleatorio.randint(1, 6))
+
+    def inscripciones():
+        aleatorio = random.Random(semilla + 2)
+        for _ in range(conteo['inscripcion']):
+            fecha = FECHA_INICIAL + timedelta(days=aleatorio.randrange(DIAS_DE_INSCRIPCION))
+            yield (
+                aleatorio.randint(1, conteo['alumno']),
+                aleatorio.randint(1, conteo['curso']),
+                fecha.isoformat()
+            )
+
+    return {
+        'alumno': (('nombre', 'email', 'ciudad'), alumnos()),
+        'curso': (('nombre', 'creditos'), cursos()),
+        'inscripcion': (('alumno_id', 'curso_id', 'fecha'), inscripciones()),
+    }
+
+
+def _cerrar_parentesis(sql, posicion):
+    """Posición siguiente al paréntesis que cierra el abierto justo antes de `posicion`"""
+    profundidad = 1
+    comilla = None
+    for i in range(posicion, len(sql)):
+        caracter = sql[i]
+        if comilla:
+            if caracter == comilla:
+                comilla = None
+        elif caracter in "'\"`":
+            comilla = caracter
+        elif caracter == '(':
+            profundidad += 1
+        elif caracter == ')':
+            profundidad -= 1
+            if profundidad == 0:
+                return i + 1
+    return None
+
+
+def tabla_escrita(sentencia):
+    """Primera tabla que modifica la sentencia, o None si solo lee"""
+    escritura = PATRON_ESCRITURA.match(quitar_cte(PATRON_COMENTARIOS.sub(' ', sentencia).strip()))
+    return escritura.group(2).lower() if escritura else None
+
+
+def quitar_cte(sql):
+    """La sentencia sin su cláusula WITH inicial, para ver qué hace después"""
+    inicio = re.match(r'WITH(?:\s+RECURSIVE)?\b', sql, re.IGNORECASE)
+    if not inicio:
+        return sql
+    posicion = inicio.end()
+    while True:
+        cte = PATRON_CTE.match(sql, posicion)
+        posicion = _cerrar_parentesis(sql, cte.end()) if cte else None
+        if posicion is None:
+            return sql
+        coma = re.compile(r'\s*,').match(sql, posicion)
+        if not coma:
+            return sql[posicion:].lstrip()
+        posicion = coma.end()
+
+
+def _lotes(filas, tamano=TAMANO_LOTE):
+    lote = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) == tamano:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+class CacheSentencias:
+    """LRU de sentencias preparadas de una conexión, con métricas de aciertos.
+
+    Las sentencias preparadas viven en la sesión del servidor, así que la
+    caché se vacía cuando cambia la conexión (reconexión o reciclaje).
+    Con `estimada=True` la caché solo imita a otra que no se puede observar
+    y sus métricas se marcan como estimadas.
+    """
+
+    def __init__(self, capacidad=CAPACIDAD_SENTENCIAS, estimada=False):
+        self.capacidad = capacidad
+        self.estimada = estimada
+        self.sentencias = OrderedDict()
+        self.conexion_actual = None
+        self._numeracion = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.reinicios = 0
+
+    def verificar_conexion(self, identidad):
+        """Vacía la caché si la conexión ya no es la misma"""
+        if identidad != self.conexion_actual:
+            if self.conexion_actual is not None:
+                self.reinicios += 1
+            self.sentencias.clear()
+            self.conexion_actual = identidad
+
+    def buscar(self, sql):
+        """Nombre de la sentencia preparada o None si hay que prepararla"""
+        if sql in self.sentencias:
+            self.sentencias.move_to_end(sql)
+            self.aciertos += 1
+            return self.sentencias[sql]
+        self.fallos += 1
+        return None
+
+    def nuevo_nombre(self):
+        self._numeracion += 1
+        return f"taller_p{self._numeracion}"
+
+    def agregar(self, sql, nombre=None):
+        """Registra una sentencia ya preparada; devuelve el nombre desalojado o None"""
+        desalojado = None
+        if len(self.sentencias) >= self.capacidad:
+            _, desalojado = self.sentencias.popitem(last=False)
+            self.desalojos += 1
+        self.sentencias[sql] = nombre or self.nuevo_nombre()
+        return desalojado
+
+    def olvidar(self, sql):
+        """Quita una sentencia cuyo nombre ya no sirve en el servidor"""
+        self.sentencias.pop(sql, None)
+
+    def metricas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'reinicios': self.reinicios,
+            'tasa_aciertos': round(self.aciertos / consultas, 4) if consultas else 0.0,
+            'estimada': self.estimada,
+        }
+
+
+class Motor(ABC):
+    """Interfaz común de los motores"""
+
+    nombre = ""
+
+    def ejecutar(self, sql, parametros=None):
+        """Ejecuta una o varias sentencias y devuelve (columnas, filas) de la última"""
+        columnas, filas = [], []
+        sentencias = [sql] if parametros is not None else dividir_sentencias(sql)
+        for sentencia in sentencias:
+            if not sentencia.strip().strip(';').strip():
+                continue
+            self._antes_de_ejecutar(sentencia)
+            cursor = self._cursor()
+            try:
+                # psycopg2 aplica el formateo con % siempre que recibe parámetros,
+                # aunque sean vacíos: sin parámetros un LIKE '%uni%' fallaría
+                if parametros is None:
+                    cursor.execute(self._adaptar(sentencia))
+                else:
+                    cursor.execute(self._adaptar(sentencia), parametros)
+                if cursor.description:
+                    columnas = [d[0] for d in cursor.description]
+                    filas = cursor.fetchall()
+            finally:
+                cursor.close()
+        return columnas, filas
+
+    @abstractmethod
+    def ejecutar_preparada(self, sql, parametros=()):
+        """Ejecuta una sentencia parametrizada reutilizando su preparación"""
+
+    @abstractmethod
+    def _cursor(self):
+        """Cursor de la conexión actual"""
+
+    @abstractmethod
+    def _insertar_lote(self, tabla, columnas, lote):
+        """Inserta un lote de filas en una tabla"""
+
+    @abstractmethod
+    def bytes_datos(self):
+        """Tamaño en disco de los datos del motor"""
+
+    @abstractmethod
+    def cerrar(self):
+        """Libera la conexión"""
+
+    def metricas_cache(self):
+        return self.cache_sentencias.metricas()
+
+    def memoria_servidor(self):
+        """Bytes que usa el servidor para esta conexión, o None si no se puede medir.
+
+        El motor embebido corre dentro del proceso: su memoria ya está en el
+        RSS del cliente.
+        """
+        return None
+
+    def preparar_escritura(self, *tablas):
+        """Deja listas para escribir las tablas indicadas (todas si no se indica ninguna).
+
+        Solo hace algo en los motores que leen de una instantánea: conviene
+        llamarlo antes de medir escrituras dentro de transacciones que se
+        revierten, porque la copia también se revertiría.
+        """
+
+    def _antes_de_ejecutar(self, sentencia):
+        pass
+
+    @contextmanager
+    def transaccion_revertida(self):
+        """Ejecuta el bloque en una transacción que siempre se revierte"""
+        self.ejecutar("BEGIN")
+        try:
+            yield self
+        finally:
+            self.ejecutar("ROLLBACK")
+
+    def crear_esquema(self):
+        for tabla in ('inscripcion', 'curso', 'alumno'):
+            self.ejecutar(f"DROP TABLE IF EXISTS {tabla}")
+        self.ejecutar(self._adaptar_ddl(SCHEMA_SQL))
+
+    def cargar_datos(self, escala, semilla=42):
+        self.crear_esquema()
+        for tabla, (columnas, filas) in generar_filas(escala, semilla).items():
+            for lote in _lotes(filas):
+                self._insertar_lote(tabla, columnas, lote)
+        self._analizar()
+
+    def _adaptar(self, sql):
+        return sql
+
+    def _adaptar_ddl(self, ddl):
+        return ddl
+
+    def _analizar(self):
+        self.ejecutar("ANALYZE")
+
+
+class MotorEmbebido(Motor):
+    """SQLite en memoria (o en un archivo), sin servidor"""
+
+    nombre = "embebido"
+
+    def __init__(self, ruta=":memory:"):
+        self.conexion = sqlite3.connect(
+            ruta, isolation_level=None, check_same_thread=False,
+            cached_statements=CAPACIDAD_SENTENCIAS_SQLITE, uri=True
+        )
+        self.conexion.execute("PRAGMA foreign_keys = ON")
+        # sqlite3 no expone su caché de sentencias compiladas: esta la imita
+        # solo con lo que pasa por ejecutar_preparada, aunque ejecutar comparte
+        # la misma caché real, así que sus métricas son una estimación
+        self.cache_sentencias = CacheSentencias(CAPACIDAD_SENTENCIAS_SQLITE, estimada=True)
+        self.cache_sentencias.verificar_conexion(id(self.conexion))
+        self.instantanea = None
+        self.tablas_instantanea = set()
+        self.claves_instantanea = {}
+
+    def montar_instantanea(self, ruta, mmap_bytes):
+        """Usa una instantánea de solo lectura como base de una capa copy-on-write.
+
+        El archivo se adjunta inmutable y mapeado en memoria, así todas las
+        conexiones del proceso comparten sus páginas. Cada tabla se lee a
+        través de una vista temporal con su nombre; la primera escritura
+        copia solo esa tabla a la base principal de esta conexión, que a
+        partir de ahí la reemplaza. Abrir el motor con ruta="" deja esa capa
+        en un archivo temporal y no en memoria.
+
+        Las claves foráneas de SQLite solo ven tablas de la misma base, así
+        que la copia se crea sin ellas y las comprueban disparadores
+        temporales que leen la vista o la copia, según corresponda. Solo se
+        replica NO ACTION/RESTRICT, la única acción que usa el esquema.
+
+        Las tablas de la instantánea no se pueden borrar: SQLite resuelve los
+        nombres sin esquema buscando también en las bases adjuntas, así que la
+        tabla original volvería a aparecer.
+        """
+        self.conexion.execute(
+            f"ATTACH DATABASE ? AS {ESQUEMA_INSTANTANEA}", (f"file:{quote(ruta)}?mode=ro&immutable=1",)
+        )
+        self.conexion.execute(f"PRAGMA {ESQUEMA_INSTANTANEA}.mmap_size = {int(mmap_bytes)}")
+        tablas = [nombre for (nombre,) in self.conexion.execute(f"""
+            SELECT name FROM {ESQUEMA_INSTANTANEA}.sqlite_master
+            WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        """).fetchall()]
+        for tabla in tablas:
+            self.conexion.execute(f"CREATE TEMP VIEW {tabla} AS SELECT * FROM {ESQUEMA_INSTANTANEA}.{tabla}")
+        self.tablas_instantanea = {tabla.lower() for tabla in tablas}
+        self.claves_instantanea = {tabla.lower(): self._claves_foraneas(tabla) for tabla in tablas}
+        self.instantanea = ruta
+
+    def _claves_foraneas(self, tabla):
+        """[(número, padre, columnas, columnas referidas)] de una tabla de la instantánea"""
+        base = ESQUEMA_INSTANTANEA
+        claves = {}
+        for numero, _, padre, columna, referida, *_ in self.conexion.execute(
+            f"PRAGMA {base}.foreign_key_list({tabla})"
+        ).fetchall():
+            clave = claves.setdefault(numero, (numero, padre.lower(), [], []))
+            clave[2].append(columna)
+            clave[3].append(referida)
+        for numero, padre, columnas, referidas in claves.values():
+            if None in referidas:
+                # REFERENCES padre sin columnas: apunta a su clave primaria
+                primaria = sorted(
+                    (fila[5], fila[1]) for fila in self.conexion.execute(f"PRAGMA {base}.table_info({padre})")
+                    if fila[5]
+                )
+                referidas[:] = [nombre for _, nombre in primaria]
+        return list(claves.values())
+
+    def _crear_disparadores(self, tabla):
+        """Disparadores que comprueban las claves foráneas en que participa una tabla copiada"""
+        error = "SELECT RAISE(ABORT, 'FOREIGN KEY constraint failed')"
+        for hija, claves in self.claves_instantanea.items():
+            for numero, padre, columnas, referidas in claves:
+                nombre = f"taller_fk_{hija}_{numero}"
+                if hija == tabla:
+                    # La fila nueva tiene que apuntar a un padre existente
+                    nulas = " OR ".join(f"NEW.{c} IS NULL" for c in columnas)
+                    existe = " AND ".join(f"{r} = NEW.{c}" for c, r in zip(columnas, referidas))
+                    cuerpo = f"{error} WHERE NOT ({nulas}) AND NOT EXISTS (SELECT 1 FROM {padre} WHERE {existe});"
+                    self.conexion.execute(
+                        f"CREATE TEMP TRIGGER {nombre}_insercion BEFORE INSERT ON main.{hija} BEGIN {cuerpo} END"
+                    )
+                    self.conexion.execute(
+                        f"CREATE TEMP TRIGGER {nombre}_cambio_hija BEFORE UPDATE OF {', '.join(columnas)} "
+                        f"ON main.{hija} BEGIN {cuerpo} END"
+                    )
+                if padre == tabla:
+                    # Una fila referenciada no se puede borrar ni cambiar de clave
+                    usada = " AND ".join(f"{c} = OLD.{r}" for c, r in zip(columnas, referidas))
+                    cuerpo = f"{error} WHERE EXISTS (SELECT 1 FROM {hija} WHERE {usada});"
+                    cambia = " OR ".join(f"NEW.{r} IS NOT OLD.{r}" for r in referidas)
+                    self.conexion.execute(
+                        f"CREATE TEMP TRIGGER {nombre}_borrado BEFORE DELETE ON main.{padre} BEGIN {cuerpo} END"
+                    )
+                    self.conexion.execute(
+                        f"CREATE TEMP TRIGGER {nombre}_cambio_padre BEFORE UPDATE OF {', '.join(referidas)} "
+                        f"ON main.{padre} WHEN {cambia} BEGIN {cuerpo} END"
+                    )
+
+    def _tablas_sin_copiar(self):
+        # Una vista temporal cambia el esquema temp, así que al borrarla se
+        # invalidan las sentencias compiladas que la usaban; una tabla nueva
+        # en main no invalidaría las que apuntaban directo a la instantánea.
+        filas = self.conexion.execute("SELECT name FROM temp.sqlite_master WHERE type = 'view'").fetchall()
+        return {nombre.lower() for (nombre,) in filas} & self.tablas_instantanea
+
+    def _copiar_tabla(self, tabla, pendientes):
+        if tabla not in pendientes:
+            return
+        pendientes.discard(tabla)
+        base = ESQUEMA_INSTANTANEA
+        (ddl,) = self.conexion.execute(
+            f"SELECT sql FROM {base}.sqlite_master WHERE type = 'table' AND lower(name) = ?", (tabla,)
+        ).fetchone()
+        ddl = PATRON_FK_COLUMNA.sub('', PATRON_FK_TABLA.sub('', ddl))
+        self.conexion.execute(f"DROP VIEW temp.{tabla}")
+        self.conexion.execute(re.sub(r'^\s*CREATE\s+TABLE\s+', 'CREATE TABLE main.', ddl, count=1, flags=re.IGNORECASE))
+        self.conexion.execute(f"INSERT INTO main.{tabla} SELECT * FROM {base}.{tabla}")
+        for (indice,) in self.conexion.execute(
+            f"SELECT sql FROM {base}.sqlite_master WHERE type = 'index' AND lower(tbl_name) = ? AND sql IS NOT NULL",
+            (tabla,)
+        ).fetchall():
+            self.conexion.execute(re.sub(r'\bINDEX\s+', 'INDEX main.', indice, count=1, flags=re.IGNORECASE))
+        self._crear_disparadores(tabla)
+
+    def preparar_escritura(self, *tablas):
+        if self.instantanea is None:
+            return
+        pendientes = self._tablas_sin_copiar()
+        for tabla in [t.lower() for t in tablas] or sorted(pendientes):
+            self._copiar_tabla(tabla, pendientes)
+
+    def _antes_de_ejecutar(self, sentencia):
+        if self.instantanea is None:
+            return
+        sql = PATRON_COMENTARIOS.sub(' ', sentencia).strip()
+        escritura = PATRON_ESCRITURA.match(quitar_cte(sql))
+        referencias = PATRON_REFERENCIAS.findall(sql) if re.match(r'CREATE\b', sql, re.IGNORECASE) else []
+        if not escritura and not referencias:
+            return
+
+        pendientes = self._tablas_sin_copiar()
+        # Una tabla nueva con REFERENCES necesita al padre en main: su clave
+        # foránea es nativa y solo ve tablas de la misma base
+        for padre in referencias:
+            self._copiar_tabla(padre.lower(), pendientes)
+        if escritura:
+            borrado, tabla = escritura.groups()
+            if borrado and tabla.lower() in self.tablas_instantanea:
+                raise sqlite3.OperationalError(
+                    f"{tabla} pertenece a la instantánea de solo lectura y no se puede borrar"
+                )
+            self._copiar_tabla(tabla.lower(), pendientes)
+
+    def ejecutar_preparada(self, sql, parametros=()):
+        # sqlite3 ya reutiliza la sentencia compilada; aquí solo se estima el acierto
+        self._antes_de_ejecutar(sql)
+        sql = self._adaptar(sql)
+        if self.cache_sentencias.buscar(sql) is None:
+            self.cache_sentencias.agregar(sql)
+        cursor = self.conexion.execute(sql, parametros)
+        filas = cursor.fetchall() if cursor.description else []
+        columnas = [d[0] for d in cursor.description] if cursor.description else []
+        return columnas, filas
+
+    def _cursor(self):
+        return self.conexion.cursor()
+
+    def _adaptar(self, sql):
+        if self.instantanea is not None and re.fullmatch(r'\s*ANALYZE\s*;?\s*', sql, re.IGNORECASE):
+            # La instantánea ya trae sus estadísticas y no admite escrituras
+            return "ANALYZE main"
+        return sql.replace('%s', '?')
+
+    def _adaptar_ddl(self, ddl):
+        return re.sub(r'\bSERIAL\s+PRIMARY\s+KEY\b', 'INTEGER PRIMARY KEY', ddl, flags=re.IGNORECASE)
+
+    def _insertar_lote(self, tabla, columnas, lote):
+        marcadores = ", ".join("?" for _ in columnas)
+        with self.conexion:
+            self.conexion.execute("BEGIN")
+            self.conexion.executemany(
+                f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcadores})", lote
+            )
+
+    def bytes_datos(self):
+        """Tamaño de las tablas visibles con sus índices, sin las internas, como en PostgreSQL.
+
+        Una tabla copiada desde la instantánea cuenta una sola vez: la copia de
+        main tapa a la original. Sin la tabla virtual dbstat (depende de cómo
+        se compiló SQLite) se suman las páginas de cada base.
+        """
+        esquemas = [
+            esquema for _, esquema, _ in self.conexion.execute("PRAGMA database_list").fetchall()
+            if esquema != 'temp'
+        ]
+        tamanos = {}
+        try:
+            # database_list trae main primero
+            for esquema in esquemas:
+                for tabla, bytes_tabla in self.conexion.execute(f"""
+                    SELECT m.tbl_name, SUM(d.pgsize) FROM dbstat(?) AS d
+                    JOIN {esquema}.sqlite_master AS m ON m.name = d.name
+                    WHERE m.tbl_name NOT LIKE 'sqlite_%'
+                    GROUP BY m.tbl_name
+                """, (esquema,)).fetchall():
+                    tamanos.setdefault(tabla.lower(), bytes_tabla)
+        except sqlite3.OperationalError:
+            return sum(
+                self.conexion.execute(f"PRAGMA {esquema}.page_count").fetchone()[0]
+                * self.conexion.execute(f"PRAGMA {esquema}.page_size").fetchone()[0]
+                for esquema in esquemas
+            )
+        return sum(tamanos.values())
+
+    def cerrar(self):
+        self.conexion.close()
+
+
+class MotorPostgres(Motor):
+    """PostgreSQL en un esquema propio para no tocar las tablas del usuario"""
+
+    nombre = "postgres"
+
+    def __init__(self, config, esquema="taller_bench", borrar_al_cerrar=True):
+        self.config = config
+        self.esquema = esquema
+        self.borrar_al_cerrar = borrar_al_cerrar
+        self.cache_sentencias = CacheSentencias()
+        self.conexion = None
+        self._conectar()
+        if borrar_al_cerrar:
+            # Un esquema que se borra al cerrar también empieza limpio, aunque
+            # una corrida anterior haya terminado sin cerrar el motor
+            self.ejecutar(f"DROP SCHEMA IF EXISTS {esquema} CASCADE")
+        self.ejecutar(f"CREATE SCHEMA IF NOT EXISTS {esquema}")
+
+    def _conectar(self):
+        import psycopg2
+
+        self.conexion = psycopg2.connect(connect_timeout=5, **self.config)
+        self.conexion.autocommit = True
+        with self.conexion.cursor() as cursor:
+            cursor.execute(f"SET search_path TO {self.esquema}")
+
+    def _cursor(self):
+        if self.conexion.closed:
+            self._conectar()
+        return self.conexion.cursor()
+
+    def ejecutar_preparada(self, sql, parametros=()):
+        cursor = self._cursor()
+        try:
+            self.cache_sentencias.verificar_conexion(
+                (id(self.conexion), self.conexion.get_backend_pid())
+            )
+            nombre = self.cache_sentencias.buscar(sql)
+            if nombre is None:
+                # Solo se registra si el PREPARE funcionó: si no, cada llamada
+                # posterior encontraría un nombre que no existe en el servidor
+                nombre = self.cache_sentencias.nuevo_nombre()
+                numeros = iter(range(1, len(parametros) + 1))
+                cursor.execute(f"PREPARE {nombre} AS " + re.sub(r'%s', lambda _: f"${next(numeros)}", sql))
+                desalojado = self.cache_sentencias.agregar(sql, nombre)
+                if desalojado:
+                    cursor.execute(f"DEALLOCATE {desalojado}")
+
+            marcadores = ", ".join("%s" for _ in parametros)
+            try:
+                cursor.execute(f"EXECUTE {nombre} ({marcadores})" if parametros else f"EXECUTE {nombre}", parametros)
+            except Exception as error:
+                # 26000: el servidor ya no tiene la sentencia (DISCARD ALL, pooler...)
+                if getattr(error, 'pgcode', None) == '26000':
+                    self.cache_sentencias.olvidar(sql)
+                raise
+            columnas = [d[0] for d in cursor.description] if cursor.description else []
+            filas = cursor.fetchall() if cursor.description else []
+            return columnas, filas
+        finally:
+            cursor.close()
+
+    def _insertar_lote(self, tabla, columnas, lote):
+        from psycopg2.extras import execute_values
+
+        with self.conexion.cursor() as cursor:
+            execute_values(
+                cursor, f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES %s", lote,
+                page_size=len(lote)
+            )
+
+    def memoria_servidor(self):
+        # pg_backend_memory_contexts existe desde PostgreSQL 14 y requiere
+        # pg_read_all_stats (o superusuario); no incluye shared_buffers
+        try:
+            _, filas = self.ejecutar("SELECT SUM(total_bytes) FROM pg_backend_memory_contexts")
+        except Exception:
+            return None
+        return int(filas[0][0]) if filas and filas[0][0] is not None else None
+
+    def bytes_datos(self):
+        _, filas = self.ejecutar("""
+            SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0)
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema() AND c.relkind = 'r'
+        """)
+        return int(filas[0][0])
+
+    def cerrar(self):
+        if self.borrar_al_cerrar and not self.conexion.closed:
+            self.ejecutar(f"DROP SCHEMA IF EXISTS {self.esquema} CASCADE")
+        self.conexion.close()
+
+
+def crear_motor(nombre, config_pg=None, **opciones):
+    if nombre == MotorEmbebido.nombre:
+        return MotorEmbebido(**opciones)
+    if nombre == MotorPostgres.nombre:
+        return MotorPostgres(config_pg or {}, **opciones)
+    raise ValueError(f"Motor desconocido: {nombre}")
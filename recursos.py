@@ -0,0 +1,34 @@
+"""Recursos estáticos (CSS y descargas) servidos por Streamlit desde static/"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+DIRECTORIO_STATIC = Path(__file__).resolve().parent / "static"
+
+
+def leer_recurso(nombre):
+    """Contenido de texto de un recurso de static/"""
+    return (DIRECTORIO_STATIC / nombre).read_text(encoding='utf-8').rstrip('\n')
+
+
+@lru_cache(maxsize=None)
+def url_recurso(nombre):
+    """URL versionada por contenido (?v=<hash>), calculada una vez por proceso.
+
+    La URL cambia cuando cambia el archivo, así que nunca se sirve una copia
+    vieja. Streamlit solo envía ETag y Last-Modified (el navegador revalida);
+    para que no revalide hay que añadir Cache-Control en el proxy de entrada.
+    """
+    version = hashlib.sha256((DIRECTORIO_STATIC / nombre).read_bytes()).hexdigest()[:12]
+    return f"app/static/{nombre}?v={version}"
+
+
+def enlace_descarga(etiqueta, nombre):
+    """Enlace de descarga a un recurso estático: en cada rerun solo viaja la URL"""
+    st.markdown(
+        f'<a class="boton-descarga" href="{url_recurso(nombre)}" download="{nombre}">{etiqueta}</a>',
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,233 @@
+"""Detección de entregas similares con MinHash y LSH.
+
+Cada entrega se normaliza con el tokenizador de editor_sql (sin literales,
+alias ni espacios), se resume en una firma MinHash sobre shingles de tokens
+y se reparte en cubetas LSH por bandas de la firma. Solo se comparan las
+entregas que comparten alguna cubeta, y de cada cubeta solo las más
+recientes, así que el costo de registrar una entrega está acotado aunque
+muchas converjan a la misma respuesta. Las entregas de las sesiones que el
+gestor de memoria purga por inactividad se olvidan también aquí.
+"""
+
+import hashlib
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import defaultdict
+
+import streamlit as st
+
+from editor_sql import identificador_alumno, tokenizar_sql
+from memoria import gestor_memoria
+
+PRIMO_MERSENNE = (1 << 61) - 1
+NUM_PERMUTACIONES = 64
+NUM_BANDAS = 16
+TAM_SHINGLE = 3
+UMBRAL_SIMILITUD = 0.8
+# Tope de comparaciones por entrega: mantiene acotado el costo aunque muchas
+# entregas converjan a la misma respuesta
+MAX_CANDIDATOS = 200
+# Tope de pares guardados; al superarlo se descartan los más antiguos
+MAX_PARES = 10000
+
+
+def normalizar_tokens(codigo):
+    """Tokens de la consulta sin literales, alias, calificadores ni espacios"""
+    tokens = [t for t in tokenizar_sql(codigo) if t[0] != 'citado']
+    calificadores = {
+        t[1].lower() for t, s in zip(tokens, tokens[1:]) if t[0] == 'palabra' and s[1] == '.'
+    }
+    normalizados = []
+    i = 0
+    while i < len(tokens):
+        tipo, valor = tokens[i][0], tokens[i][1]
+        anterior = tokens[i - 1] if i > 0 else None
+        siguiente = tokens[i + 1] if i + 1 < len(tokens) else None
+
+        if tipo in ('cadena', 'numero'):
+            normalizados.append('?')
+        elif tipo == 'palabra' and valor.upper() == 'AS':
+            # "AS alias": se descarta el alias completo
+            if siguiente and siguiente[0] == 'palabra':
+                i += 1
+        elif tipo == 'palabra' and siguiente and siguiente[1] == '.':
+            # "a.columna": se descarta el calificador
+            i += 1
+        elif (tipo == 'palabra' and valor.lower() in calificadores and anterior
+              and anterior[0] == 'palabra'
+              and anterior[1].upper() not in ('FROM', 'JOIN', 'UPDATE', 'INTO', 'TABLE')):
+            # "FROM alumno a": se descarta el alias de tabla
+            pass
+        elif tipo == 'palabra':
+            normalizados.append(valor.lower())
+        elif valor != ';':
+            normalizados.append(valor)
+        i += 1
+    return normalizados
+
+
+def _shingles(tokens):
+    if len(tokens) < TAM_SHINGLE:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + TAM_SHINGLE]) for i in range(len(tokens) - TAM_SHINGLE + 1)}
+
+
+def _hash_shingle(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class MotorSimilitud:
+    """Índice LSH incremental de firmas MinHash, compartido por todas las sesiones"""
+
+    def __init__(self, permutaciones=NUM_PERMUTACIONES, bandas=NUM_BANDAS, umbral=UMBRAL_SIMILITUD):
+        aleatorio = random.Random(1)
+        self.coeficientes = [
+            (aleatorio.randrange(1, PRIMO_MERSENNE), aleatorio.randrange(0, PRIMO_MERSENNE))
+            for _ in range(permutaciones)
+        ]
+        self.bandas = bandas
+        self.filas_por_banda = permutaciones // bandas
+        self.umbral = umbral
+
+        self._lock = threading.Lock()
+        self.entregas = {}
+        # Cada cubeta es un dict como conjunto ordenado: las más recientes al final
+        self.cubetas = defaultdict(dict)
+        self.pares = {}
+        self.pares_por_entrega = defaultdict(set)
+        self.claves_por_sesion = defaultdict(set)
+
+    def firma(self, tokens):
+        hashes = [_hash_shingle(s) for s in _shingles(tokens)]
+        return tuple(
+            min((a * h + b) % PRIMO_MERSENNE for h in hashes)
+            for a, b in self.coeficientes
+        )
+
+    def _claves_cubeta(self, ejercicio, firma):
+        for banda in range(self.bandas):
+            inicio = banda * self.filas_por_banda
+            yield (ejercicio, banda, firma[inicio:inicio + self.filas_por_banda])
+
+    @staticmethod
+    def similitud_estimada(firma_a, firma_b):
+        return sum(a == b for a, b in zip(firma_a, firma_b)) / len(firma_a)
+
+    def agregar(self, alumno, ejercicio, codigo, referencias=()):
+        """Registra (o reemplaza) la entrega de un alumno y devuelve sus pares similares.
+
+        `alumno` es (id_sesion, nombre): el nombre es texto libre, así que la
+        sesión distingue a dos alumnos con el mismo nombre, y las entregas de
+        una misma sesión nunca se comparan entre sí. Las entregas iguales a
+        alguna referencia (plantilla o snippet del reto) se ignoran para no
+        marcar como copia a quien no modificó nada.
+        """
+        tokens = normalizar_tokens(codigo)
+        if len(tokens) < TAM_SHINGLE or any(tokens == normalizar_tokens(r) for r in referencias):
+            return []
+
+        firma = self.firma(tokens)
+        clave = (alumno, ejercicio)
+
+        with self._lock:
+            self._quitar(clave)
+            self.entregas[clave] = {
+                'firma': firma, 'codigo': codigo, 'momento': time.time()
+            }
+            self.claves_por_sesion[alumno[0]].add(clave)
+
+            candidatos = set()
+            for clave_cubeta in self._claves_cubeta(ejercicio, firma):
+                cubeta = self.cubetas[clave_cubeta]
+                candidatos.update(itertools.islice(reversed(cubeta), MAX_CANDIDATOS))
+                cubeta[clave] = None
+
+            recientes = heapq.nlargest(
+                MAX_CANDIDATOS, candidatos, key=lambda c: self.entregas[c]['momento']
+            )
+
+            similares = []
+            for otro in recientes:
+                if otro[0][0] == alumno[0]:
+                    continue
+                similitud = self.similitud_estimada(firma, self.entregas[otro]['firma'])
+                if similitud >= self.umbral:
+                    self._guardar_par(tuple(sorted((clave, otro))), similitud)
+                    similares.append((otro[0], similitud))
+            return similares
+
+    def _guardar_par(self, par, similitud):
+        self.pares[par] = similitud
+        for clave in par:
+            self.pares_por_entrega[clave].add(par)
+        while len(self.pares) > MAX_PARES:
+            self._olvidar_par(next(iter(self.pares)))
+
+    def _olvidar_par(self, par):
+        del self.pares[par]
+        for clave in par:
+            self.pares_por_entrega[clave].discard(par)
+            if not self.pares_por_entrega[clave]:
+                del self.pares_por_entrega[clave]
+
+    def purgar_sesiones(self, activas):
+        """Olvida las entregas de las sesiones que ya no están en `activas`"""
+        with self._lock:
+            for sesion in [s for s in self.claves_por_sesion if s not in activas]:
+                for clave in list(self.claves_por_sesion[sesion]):
+                    self._quitar(clave)
+
+    def _quitar(self, clave):
+        anterior = self.entregas.pop(clave, None)
+        if anterior is None:
+            return
+        sesion = clave[0][0]
+        self.claves_por_sesion[sesion].discard(clave)
+        if not self.claves_por_sesion[sesion]:
+            del self.claves_por_sesion[sesion]
+        for clave_cubeta in self._claves_cubeta(clave[1], anterior['firma']):
+            self.cubetas[clave_cubeta].pop(clave, None)
+            if not self.cubetas[clave_cubeta]:
+                del self.cubetas[clave_cubeta]
+        for par in list(self.pares_por_entrega.get(clave, ())):
+            self._olvidar_par(par)
+
+    def pares_similares(self):
+        """[(ejercicio, alumno_a, alumno_b, similitud, codigo_a, codigo_b)] de mayor a menor"""
+        with self._lock:
+            resultado = [
+                (a[1], nombre_visible(a[0]), nombre_visible(b[0]), similitud,
+                 self.entregas[a]['codigo'], self.entregas[b]['codigo'])
+                for (a, b), similitud in self.pares.items()
+            ]
+        return sorted(resultado, key=lambda p: -p[3])
+
+
+def nombre_visible(alumno):
+    """'nombre · sesión' para identificar al alumno en la vista docente"""
+    sesion, nombre = alumno
+    return f"{nombre} · {sesion}"
+
+
+@st.cache_resource(show_spinner=False)
+def motor_similitud():
+    return MotorSimilitud()
+
+
+def purgar_inactivas(sesion_actual=None):
+    """Aplica al motor de similitud la misma purga de sesiones inactivas que al de memoria"""
+    activas = gestor_memoria().sesiones_activas()
+    if sesion_actual:
+        # En su primera ejecución la sesión todavía no registró su huella
+        activas.add(sesion_actual)
+    motor_similitud().purgar_sesiones(activas)
+
+
+def registrar_entrega(ejercicio, codigo, referencias=()):
+    """Registra la entrega de la sesión actual en el motor de similitud"""
+    purgar_inactivas(st.session_state.id_sesion)
+    alumno = (st.session_state.id_sesion, identificador_alumno())
+    return motor_similitud().agregar(alumno, ejercicio, codigo, referencias)
@@ -0,0 +1,22 @@
+-- schema.sql - DDL mínimo para sistema universitario
+-- Base de Datos I - Semana 3
+
+CREATE TABLE alumno (
+    alumno_id SERIAL PRIMARY KEY,
+    nombre VARCHAR(80) NOT NULL,
+    email VARCHAR(120) UNIQUE NOT NULL,
+    ciudad VARCHAR(60)
+);
+
+CREATE TABLE curso (
+    curso_id SERIAL PRIMARY KEY,
+    nombre VARCHAR(100) NOT NULL,
+    creditos INT CHECK (creditos BETWEEN 1 AND 6)
+);
+
+CREATE TABLE inscripcion (
+    inscripcion_id SERIAL PRIMARY KEY,
+    alumno_id INT NOT NULL REFERENCES alumno(alumno_id),
+    curso_id INT NOT NULL REFERENCES curso(curso_id),
+    fecha DATE NOT NULL DEFAULT CURRENT_DATE
+);
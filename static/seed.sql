@@ -0,0 +1,14 @@
+-- seed.sql - DML de ejemplo
+-- Base de Datos I - Semana 3
+
+INSERT INTO alumno (nombre, email, ciudad) VALUES
+('Ana Gómez', 'ana.gomez@uni.edu', 'Medellín'),
+('Luis Ríos', 'luis.rios@uni.edu', 'Bogotá'),
+('Sara Díaz', 'sara.diaz@uni.edu', 'Cali');
+
+INSERT INTO curso (nombre, creditos) VALUES
+('Base de Datos I', 3),
+('Programación I', 4);
+
+INSERT INTO inscripcion (alumno_id, curso_id) VALUES 
+(1, 1), (2, 1), (3, 2);
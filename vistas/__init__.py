@@ -0,0 +1,30 @@
+"""Registro de vistas: cada sección se importa la primera vez que se selecciona"""
+
+import importlib
+
+REGISTRO_VISTAS = {
+    "Inicio": ("vistas.inicio", "vista_inicio"),
+    "Contexto & Schema": ("vistas.contexto", "vista_contexto"),
+    "Ejercicios Guiados": ("vistas.ejercicios_guiados", "vista_ejercicios_guiados"),
+    "Práctica Autónoma": ("vistas.practica_autonoma", "vista_practica_autonoma"),
+    "Cheat-sheet": ("vistas.cheatsheet", "vista_cheatsheet"),
+    "Conexión PostgreSQL": ("vistas.conexion", "vista_conexion"),
+    "Laboratorio de Concurrencia": ("vistas.concurrencia", "vista_concurrencia"),
+    "Laboratorio de Particiones": ("vistas.particiones", "vista_particiones"),
+    "Rendimiento": ("vistas.rendimiento", "vista_rendimiento"),
+    "Similitud de Entregas": ("vistas.similitud", "vista_similitud"),
+    "Benchmark de Motores": ("vistas.benchmark", "vista_benchmark"),
+}
+
+VISTAS_DOCENTE = {"Rendimiento", "Similitud de Entregas", "Benchmark de Motores"}
+
+
+def secciones_disponibles(modo_docente):
+    """Secciones del menú; las de docente solo aparecen en modo docente"""
+    return [nombre for nombre in REGISTRO_VISTAS if modo_docente or nombre not in VISTAS_DOCENTE]
+
+
+def cargar_vista(nombre):
+    """Importa el módulo de la vista (solo la primera vez) y devuelve su función"""
+    modulo, funcion = REGISTRO_VISTAS[nombre]
+    return getattr(importlib.import_module(modulo), funcion)
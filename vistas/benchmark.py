@@ -0,0 +1,117 @@
+import json
+
+import streamlit as st
+
+from benchmark_motores import UMBRAL_P95_MS, ejecutar_benchmark, tabla_resultados
+from estado import config_postgres
+from memoria import guardar_resultado, obtener_resultado
+
+
+def _mb(valor):
+    return round(valor / 1024 / 1024, 2) if valor is not None else None
+
+
+def vista_benchmark():
+    st.markdown("## Benchmark de Motores (Modo Docente)")
+    
+    st.markdown(f"""
+    Corre la misma carga en el motor embebido (SQLite) y en PostgreSQL: las soluciones
+    de los ejercicios guiados, los snippets de los retos y una mezcla parametrizada de
+    SELECT/UPDATE sobre datos generados. Una escala de 1 equivale a 1.000 alumnos,
+    50 cursos y 5.000 inscripciones. Se considera aceptable un p95 de hasta
+    {UMBRAL_P95_MS:.0f} ms por operación.
+    """)
+    
+    with st.form("form_benchmark"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            motores = st.multiselect(
+                "Motores", ["embebido", "postgres"], default=["embebido"],
+                help="PostgreSQL usa la conexión del sidebar y un esquema temporal taller_bench"
+            )
+            escalas = st.multiselect("Escalas", [1, 10, 100, 1000], default=[1, 10])
+        
+        with col2:
+            repeticiones = st.number_input("Repeticiones por ejercicio/reto", 1, 200, 20)
+            operaciones = st.number_input("Operaciones de la mezcla", 100, 100000, 1000, step=100)
+            semilla = st.number_input("Semilla", 0, 10**6, 42)
+        
+        ejecutar = st.form_submit_button("Ejecutar benchmark")
+    
+    if ejecutar:
+        if not motores or not escalas:
+            st.warning("Selecciona al menos un motor y una escala")
+        else:
+            barra = st.progress(0.0)
+            try:
+                resultados = ejecutar_benchmark(
+                    motores=motores, escalas=sorted(escalas), repeticiones=int(repeticiones),
+                    operaciones_mezcla=int(operaciones), semilla=int(semilla),
+                    config_pg=config_postgres(),
+                    al_progresar=lambda fraccion, mensaje: barra.progress(fraccion, text=mensaje)
+                )
+            except ImportError:
+                st.error("psycopg2 no está instalado: `pip install psycopg2-binary`")
+                return
+            except Exception as e:
+                st.error(f"Error durante el benchmark: {e}")
+                return
+            guardar_resultado("benchmark_motores", resultados)
+    
+    resultados = obtener_resultado("benchmark_motores")
+    if resultados is None:
+        return
+    
+    st.markdown("### Resumen")
+    
+    resumen = resultados['resumen']
+    cols = st.columns(max(1, len(resumen['escala_maxima'])))
+    for col, (motor, escala) in zip(cols, resumen['escala_maxima'].items()):
+        with col:
+            st.metric(
+                f"Mayor escala aceptable ({motor})",
+                escala if escala is not None else "ninguna"
+            )
+    
+    st.dataframe({
+        "Motor": [r['motor'] for r in resultados['resultados']],
+        "Escala": [r['escala'] for r in resultados['resultados']],
+        "Inscripciones": [r['filas']['inscripcion'] for r in resultados['resultados']],
+        "Carga de datos (s)": [r['carga_s'] for r in resultados['resultados']],
+        "Preparación (s)": [r['preparacion_s'] for r in resultados['resultados']],
+        "Datos (MB)": [round(r['datos_bytes'] / 1024 / 1024, 2) for r in resultados['resultados']],
+        "Δ RSS cliente (MB)": [_mb(r['rss_cliente_delta_bytes']) for r in resultados['resultados']],
+        "Memoria servidor (MB)": [_mb(r['memoria_servidor_bytes']) for r in resultados['resultados']],
+        "Mezcla (ops/s)": [r['mezcla_ops_s'] for r in resultados['resultados']],
+        "Aciertos caché sentencias": [
+            f"{r['cache_sentencias']['tasa_aciertos']:.1%}"
+            + (" (estimado)" if r['cache_sentencias'].get('estimada') else "")
+            for r in resultados['resultados']
+        ],
+        "Peor p95 (ms)": [
+            resumen['peor_p95_ms'][r['motor']][str(r['escala'])] for r in resultados['resultados']
+        ]
+    }, width="stretch")
+    
+    st.caption("""
+    Carga de datos: lo que cuesta generar e insertar las filas (en el motor embebido, lo
+    que tardó construir su instantánea). Preparación: lo que tardó esta corrida en dejar
+    el motor listo, incluida la copia de las tablas que se escriben. Datos: tablas e
+    índices, sin contar dos veces las tablas copiadas desde la instantánea.
+    Δ RSS cliente: memoria que ganó el proceso de la app durante cada paso (incluye
+    SQLite, que corre dentro de él). Memoria servidor: contextos de memoria del backend
+    de PostgreSQL (PostgreSQL 14+ con pg_read_all_stats), sin contar shared_buffers.
+    La caché de sentencias de SQLite no se puede observar desde Python: su tasa de
+    aciertos es una estimación con el mismo tamaño de caché que usa sqlite3.
+    """)
+    
+    st.markdown("### Latencias por operación")
+    st.dataframe(tabla_resultados(resultados), width="stretch")
+    
+    st.download_button(
+        label="Descargar resultados (JSON)",
+        data=json.dumps(resultados, indent=2, ensure_ascii=False),
+        file_name=f"benchmark_motores_{resultados['fecha'][:10]}.json",
+        mime="application/json"
+    )
@@ -0,0 +1,79 @@
+import streamlit as st
+
+from recursos import enlace_descarga
+
+
+def vista_cheatsheet():
+    st.markdown("## Cheat-sheet SQL")
+    
+    st.markdown("### Referencia Rápida de Comandos")
+    
+    comandos = {
+        "Comando": [
+            "INSERT INTO", "UPDATE", "DELETE FROM", "SELECT",
+            "WHERE", "ORDER BY", "LIMIT", "ALTER TABLE ADD",
+            "ALTER TABLE DROP", "CREATE TABLE", "DROP TABLE"
+        ],
+        "Categoría": [
+            "DML", "DML", "DML", "DQL",
+            "Filtro", "Orden", "Límite", "DDL",
+            "DDL", "DDL", "DDL"
+        ],
+        "Descripción": [
+            "Inserta nuevos registros en una tabla",
+            "Actualiza registros existentes",
+            "Elimina registros de una tabla",
+            "Recupera datos de una o más tablas",
+            "Filtra resultados según condiciones",
+            "Ordena resultados (ASC/DESC)",
+            "Limita cantidad de resultados",
+            "Agrega nueva columna a tabla",
+            "Elimina columna de tabla",
+            "Crea nueva tabla",
+            "Elimina tabla completamente"
+        ]
+    }
+    
+    st.table(comandos)
+    
+    st.divider()
+    
+    st.markdown("### Mini-Ejemplos")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### DML - Manipulación de Datos")
+        
+        st.markdown("**INSERT**")
+        st.code("""INSERT INTO tabla (col1, col2) 
+VALUES (valor1, valor2);""", language='sql')
+        
+        st.markdown("**UPDATE**")
+        st.code("""UPDATE tabla 
+SET col1 = nuevo_valor 
+WHERE condicion;""", language='sql')
+        
+        st.markdown("**DELETE**")
+        st.code("""DELETE FROM tabla 
+WHERE condicion;""", language='sql')
+    
+    with col2:
+        st.markdown("#### DQL - Consultas")
+        
+        st.markdown("**SELECT básico**")
+        st.code("""SELECT col1, col2 
+FROM tabla 
+WHERE condicion 
+ORDER BY col1 DESC 
+LIMIT 10;""", language='sql')
+        
+        st.markdown("**DDL - Modificación**")
+        st.code("""ALTER TABLE tabla 
+ADD COLUMN nueva_col VARCHAR(50);
+
+ALTER TABLE tabla 
+DROP COLUMN col_existente;""", language='sql')
+    
+    # guía
+    enlace_descarga("Descargar Guía Completa (TXT)", "guia_taller_sql.txt")
@@ -0,0 +1,100 @@
+import streamlit as st
+
+from estado import config_postgres
+from laboratorio_concurrencia import NIVELES_AISLAMIENTO, ejecutar_laboratorio
+from memoria import guardar_resultado, obtener_resultado
+
+MAX_CORRIDAS_GUARDADAS = 10
+
+
+def mostrar_metricas(metricas, contenedor):
+    with contenedor.container():
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Confirmadas", metricas['confirmadas'])
+        col2.metric("Throughput (tx/s)", metricas['throughput_tps'])
+        col3.metric("Esperas por bloqueo", metricas['esperas_bloqueo'])
+        col4.metric("Deadlocks", metricas['deadlocks'])
+        col5.metric("Fallos de serialización", metricas['fallos_serializacion'])
+        st.caption(
+            f"{metricas['segundos']:.1f} s · p50 {metricas['p50_ms']} ms · p95 {metricas['p95_ms']} ms · "
+            f"esperando ahora: {metricas['esperando_ahora']} · abandonadas: {metricas['abandonadas']}"
+        )
+
+
+def vista_concurrencia():
+    st.markdown("## Laboratorio de Concurrencia")
+    
+    st.markdown("""
+    Varios clientes simulados ejecutan a la vez transacciones sobre `alumno`, `curso`
+    e `inscripcion`: actualizan créditos, se inscriben (leen y luego escriben) y cambian
+    la ciudad de dos alumnos en orden aleatorio. Como todos trabajan sobre pocas filas
+    "calientes", aparecen esperas por bloqueo, deadlocks y fallos de serialización.
+    Con la misma semilla cada cliente repite exactamente las mismas operaciones.
+    """)
+    
+    with st.form("form_concurrencia"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            motor = st.radio(
+                "Motor", ["embebido", "postgres"], horizontal=True,
+                help="PostgreSQL usa la conexión del sidebar y un esquema temporal taller_lab"
+            )
+            aislamiento = st.selectbox("Nivel de aislamiento", NIVELES_AISLAMIENTO)
+            clientes = st.slider("Clientes concurrentes", 1, 32, 8)
+        
+        with col2:
+            transacciones = st.number_input("Transacciones por cliente", 1, 1000, 50)
+            filas_calientes = st.slider(
+                "Filas calientes", 2, 50, 5,
+                help="Cuantas menos filas, más contención"
+            )
+            semilla = st.number_input("Semilla", 0, 10**6, 42)
+        
+        ejecutar = st.form_submit_button("Ejecutar simulación")
+    
+    if motor == "embebido":
+        st.caption("""
+        SQLite siempre es serializable y tiene un único bloqueo de escritura por base:
+        el nivel de aislamiento solo aplica a PostgreSQL y no se forman deadlocks.
+        """)
+    
+    corridas = obtener_resultado("laboratorio_concurrencia", [])
+    
+    if ejecutar:
+        panel = st.empty()
+        try:
+            metricas = ejecutar_laboratorio(
+                motor=motor, clientes=clientes, transacciones_por_cliente=int(transacciones),
+                aislamiento=aislamiento, filas_calientes=filas_calientes, semilla=int(semilla),
+                config_pg=config_postgres(),
+                al_actualizar=lambda m: mostrar_metricas(m, panel)
+            )
+        except ImportError:
+            st.error("psycopg2 no está instalado: `pip install psycopg2-binary`")
+            return
+        except Exception as e:
+            st.error(f"Error durante la simulación: {e}")
+            return
+        
+        mostrar_metricas(metricas, panel)
+        for error in metricas['errores']:
+            st.warning(error)
+        
+        corridas = [metricas] + corridas[:MAX_CORRIDAS_GUARDADAS - 1]
+        guardar_resultado("laboratorio_concurrencia", corridas)
+    
+    if corridas:
+        st.markdown("### Corridas anteriores")
+        st.dataframe({
+            "Motor": [c['motor'] for c in corridas],
+            "Aislamiento": [c['aislamiento'] for c in corridas],
+            "Clientes": [c['clientes'] for c in corridas],
+            "Filas calientes": [c['filas_calientes'] for c in corridas],
+            "Semilla": [c['semilla'] for c in corridas],
+            "tx/s": [c['throughput_tps'] for c in corridas],
+            "Esperas": [c['esperas_bloqueo'] for c in corridas],
+            "Deadlocks": [c['deadlocks'] for c in corridas],
+            "Fallos serialización": [c['fallos_serializacion'] for c in corridas],
+            "Abandonadas": [c['abandonadas'] for c in corridas]
+        }, width="stretch")
@@ -0,0 +1,101 @@
+import streamlit as st
+
+
+def vista_conexion():
+    st.markdown("## Conexión a PostgreSQL (Opcional)")
+    
+    st.warning("""
+    **Advertencia:** Esta sección es opcional y con fines demostrativos. 
+    No se ejecutará código real contra la base de datos.
+    """)
+    
+    st.markdown("""
+    ### Configuración de Conexión
+    
+    Para conectarte a PostgreSQL desde Python, necesitas la librería `psycopg2`. 
+    Los parámetros de conexión se configuran en el sidebar.
+    """)
+    
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info(f"""
+        **Parámetros actuales:**
+        - Host: {st.session_state.get('db_host', 'localhost')}
+        - Puerto: {st.session_state.get('db_puerto', '5432')}
+        - Base de datos: {st.session_state.get('db_nombre', 'universidad')}
+        - Usuario: {st.session_state.get('db_usuario', 'postgres')}
+        """)
+    
+    with col2:
+        st.info("""
+        **Requisitos:**
+        - PostgreSQL 17 instalado
+        - psycopg2 instalado: `pip install psycopg2`
+        - Credenciales válidas
+        - Servicio PostgreSQL activo
+        """)
+    
+    # Código de ejemplo
+    if st.button("Mostrar ejemplo de conexión"):
+        st.markdown("### Código de Ejemplo")
+        
+        codigo_conexion = f"""
+import psycopg2
+from psycopg2 import sql
+
+# Parámetros de conexión
+config = {{
+    'host': '{st.session_state.get('db_host', 'localhost')}',
+    'port': '{st.session_state.get('db_puerto', '5432')}',
+    'database': '{st.session_state.get('db_nombre', 'universidad')}',
+    'user': '{st.session_state.get('db_usuario', 'postgres')}',
+    'password': 'tu_contraseña_aqui'
+}}
+
+def ejecutar_scripts():
+    try:
+        # Establecer conexión
+        conn = psycopg2.connect(**config)
+        cursor = conn.cursor()
+        
+        # Leer y ejecutar schema.sql
+        with open('schema.sql', 'r') as f:
+            schema = f.read()
+            cursor.execute(schema)
+        
+        # Leer y ejecutar seed.sql
+        with open('seed.sql', 'r') as f:
+            seed = f.read()
+            cursor.execute(seed)
+        
+        # Confirmar cambios
+        conn.commit()
+        print("Scripts ejecutados exitosamente")
+        
+        # Consulta de verificación
+        cursor.execute("SELECT COUNT(*) FROM alumno;")
+        count = cursor.fetchone()[0]
+        print(f"Total de alumnos: {{count}}")
+        
+    except psycopg2.Error as e:
+        print(f"Error de PostgreSQL: {{e}}")
+        conn.rollback()
+    
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# NO EJECUTAR - Solo ejemplo
+# ejecutar_scripts()
+"""
+        
+        st.code(codigo_conexion, language='python')
+        
+        st.info("""
+        **Nota:** Este código es solo un ejemplo. No lo ejecutes directamente 
+        sin verificar las credenciales y tener respaldo de tu base de datos.
+        """)
@@ -0,0 +1,73 @@
+import streamlit as st
+
+from contenido import SCHEMA_SQL, SEED_SQL
+from recursos import enlace_descarga
+
+
+def vista_contexto():
+    st.markdown("## Contexto & Mini-Esquema")
+    
+    st.markdown("""
+    ### Dominio: Sistema Universitario Simplificado
+    
+    Trabajaremos con un modelo básico de gestión académica que incluye:
+    - **Alumnos**: Estudiantes registrados en la universidad
+    - **Cursos**: Asignaturas disponibles con sus créditos
+    - **Inscripciones**: Relación entre alumnos y cursos
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Estructura de Datos (DDL)")
+        st.code(SCHEMA_SQL, language='sql')
+        
+        enlace_descarga("Descargar schema.sql", "schema.sql")
+    
+    with col2:
+        st.markdown("#### Datos de Ejemplo (DML)")
+        st.code(SEED_SQL, language='sql')
+        
+        enlace_descarga("Descargar seed.sql", "seed.sql")
+    
+    st.divider()
+    
+    st.markdown("### Visualización de Datos")
+    
+    tab1, tab2, tab3 = st.tabs(["Tabla: alumno", "Tabla: curso", "Tabla: inscripcion"])
+    
+    with tab1:
+        alumnos_data = {
+            "alumno_id": [1, 2, 3],
+            "nombre": ["Ana Gómez", "Luis Ríos", "Sara Díaz"],
+            "email": ["ana.gomez@uni.edu", "luis.rios@uni.edu", "sara.diaz@uni.edu"],
+            "ciudad": ["Medellín", "Bogotá", "Cali"]
+        }
+        st.table(alumnos_data)
+    
+    with tab2:
+        cursos_data = {
+            "curso_id": [1, 2],
+            "nombre": ["Base de Datos I", "Programación I"],
+            "creditos": [3, 4]
+        }
+        st.table(cursos_data)
+    
+    with tab3:
+        inscripciones_data = {
+            "inscripcion_id": [1, 2, 3],
+            "alumno_id": [1, 2, 3],
+            "curso_id": [1, 1, 2],
+            "fecha": ["2025-01-15", "2025-01-15", "2025-01-16"]
+        }
+        st.table(inscripciones_data)
+    
+    if st.session_state.modo_docente:
+        st.markdown("""
+        <div class="solucion-card">
+        <strong>Nota para el docente:</strong> 
+        Este esquema es intencionalmente simple para facilitar el aprendizaje. 
+        En producción, consideraría índices adicionales, constraints más complejos 
+        y normalización adicional.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,81 @@
+import streamlit as st
+
+from contenido import EJERCICIOS_GUIADOS
+from editor_sql import etiquetar_consulta, mostrar_asistente_nombres, validar_sintaxis_sql
+from estado import bit_activo, contar_bits, marcar_bit
+from similitud import registrar_entrega
+
+
+def vista_ejercicios_guiados():
+    st.markdown("## Ejercicios Guiados (Paso a Paso)")
+    
+    ejercicios = EJERCICIOS_GUIADOS
+    
+    for i, ejercicio in enumerate(ejercicios):
+        with st.container():
+            col1, col2 = st.columns([10, 1])
+            
+            with col1:
+                st.markdown(f"### {ejercicio['titulo']}")
+            
+            with col2:
+                st.session_state.ejercicios_completados = marcar_bit(
+                    st.session_state.ejercicios_completados, i,
+                    st.checkbox(
+                        "✓",
+                        key=f"guiado_{i}",
+                        value=bit_activo(st.session_state.ejercicios_completados, i)
+                    )
+                )
+            
+            st.markdown(f"**Enunciado:** {ejercicio['enunciado']}")
+            
+            with st.expander("💡 Ver pista"):
+                st.info(ejercicio['pista'])
+            
+            
+            codigo = st.text_area(
+                "Tu solución:",
+                value=ejercicio['plantilla'],
+                height=100,
+                key=f"codigo_guiado_{i}"
+            )
+            mostrar_asistente_nombres(codigo)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button(f"Validar sintaxis", key=f"validar_{i}"):
+                    valido, mensaje = validar_sintaxis_sql(codigo)
+                    if valido:
+                        st.success(mensaje)
+                        st.caption("Para ejecutarlo en PostgreSQL:")
+                        st.code(etiquetar_consulta(codigo, f"guiado_{i + 1}"), language='sql')
+                        registrar_entrega(
+                            f"guiado_{i + 1}", codigo,
+                            referencias=(ejercicio['plantilla'], ejercicio['solucion'])
+                        )
+                    else:
+                        st.warning(mensaje)
+            
+            with col2:
+                if st.session_state.modo_docente or st.button(f"Ver solución", key=f"sol_{i}"):
+                    st.session_state.soluciones_reveladas = marcar_bit(st.session_state.soluciones_reveladas, i)
+            
+            if bit_activo(st.session_state.soluciones_reveladas, i):
+                if st.session_state.modo_docente:
+                    st.markdown("**Solución (Modo Docente):**")
+                    st.code(ejercicio['solucion'], language='sql')
+                else:
+                    st.info("Activa el 'Modo Docente' en el sidebar para ver la solución completa")
+            
+            st.divider()
+    
+    
+    completados = contar_bits(st.session_state.ejercicios_completados)
+    total = len(ejercicios)
+    
+    if completados == total:
+        st.success(f"¡Excelente! Has completado todos los {total} ejercicios guiados.")
+    else:
+        st.info(f"Progreso: {completados}/{total} ejercicios completados")
@@ -0,0 +1,83 @@
+import streamlit as st
+
+from estado import calcular_progreso
+
+
+def vista_inicio():
+    st.markdown("""
+    <div class="header-taller">
+        <h1>Semana 3 – Taller Interactivo de SQL (DDL/DML/SELECT)</h1>
+        <p>Base de Datos I | Universidad Digital</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    ### Objetivos de Aprendizaje
+    
+    En este taller interactivo aprenderás a trabajar con los comandos SQL fundamentales 
+    para la definición y manipulación de datos en PostgreSQL 17. Al finalizar, serás 
+    capaz de crear estructuras de datos básicas y realizar operaciones CRUD completas.
+    """)
+    
+    st.markdown("### Logros Esperados")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **Crear Tablas (DDL)**
+        - Definir estructuras básicas
+        - Establecer restricciones
+        - Modificar tablas existentes
+        """)
+    
+    with col2:
+        st.markdown("""
+        **Manipular Datos (DML)**
+        - INSERT de registros
+        - UPDATE de información
+        - DELETE selectivo
+        """)
+    
+    with col3:
+        st.markdown("""
+        **Consultar (SELECT)**
+        - Filtros con WHERE
+        - Ordenamiento básico
+        - Selección de columnas
+        """)
+    
+    st.divider()
+    
+    st.markdown("### Indicador de Progreso")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.session_state.objetivos_completados['lei_objetivos'] = st.checkbox(
+            "✓ Leí los objetivos",
+            value=st.session_state.objetivos_completados['lei_objetivos']
+        )
+    
+    with col2:
+        st.session_state.objetivos_completados['complete_guiados'] = st.checkbox(
+            "✓ Completé ejercicios guiados",
+            value=st.session_state.objetivos_completados['complete_guiados']
+        )
+    
+    with col3:
+        st.session_state.objetivos_completados['hice_autonomos'] = st.checkbox(
+            "✓ Hice práctica autónoma",
+            value=st.session_state.objetivos_completados['hice_autonomos']
+        )
+    
+    progreso = calcular_progreso()
+    st.progress(progreso / 100)
+    st.info(f"Progreso total del taller: {progreso:.1f}%")
+    
+    if st.session_state.modo_docente:
+        st.markdown("""
+        <div class="solucion-card">
+        <strong>Modo Docente Activo:</strong> Las soluciones y notas para el profesor están visibles.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,131 @@
+import streamlit as st
+
+from estado import config_postgres
+from laboratorio_particiones import FECHA_CORTE, ejecutar_laboratorio, sql_drop_particiones
+from memoria import guardar_resultado, obtener_resultado
+
+NOMBRES_OPERACION = {
+    'contar_antes_corte': f"COUNT con fecha < '{FECHA_CORTE}'",
+    'contar_un_mes': "COUNT de marzo 2025",
+    'borrar_antes_corte': f"DELETE con fecha < '{FECHA_CORTE}'",
+    'drop_particiones': "DROP de particiones + DELETE del mes del corte",
+}
+
+
+def vista_particiones():
+    st.markdown("## Laboratorio de Particiones")
+    
+    st.markdown(f"""
+    Cuando `inscripcion` tiene millones de filas, `fecha` es la clave natural para
+    particionar por rango: cada mes vive en su propia partición y una consulta con
+    `WHERE fecha < '{FECHA_CORTE}'` (el reto de DELETE) solo necesita leer los meses
+    que cubre. Este laboratorio crea la tabla plana y una variante particionada por mes
+    con los mismos datos, corre la misma carga en ambas dentro de transacciones que se
+    revierten y compara los planes y las latencias.
+    """)
+    
+    with st.form("form_particiones"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            motor = st.radio(
+                "Motor", ["embebido", "postgres"], horizontal=True,
+                help="PostgreSQL usa la conexión del sidebar y un esquema temporal taller_part"
+            )
+            escala = st.select_slider(
+                "Escala", [1, 10, 50, 200], value=10,
+                help="Escala 1 = 5.000 inscripciones; escala 200 = 1.000.000"
+            )
+        
+        with col2:
+            repeticiones = st.number_input("Repeticiones por consulta", 1, 50, 5)
+            indice_fecha = st.checkbox(
+                "Crear índice en fecha",
+                help="Compara la poda de particiones contra un índice B-tree en la tabla plana"
+            )
+        
+        ejecutar = st.form_submit_button("Ejecutar laboratorio")
+    
+    if motor == "embebido":
+        st.caption("""
+        SQLite no tiene particionamiento declarativo: el motor embebido usa una tabla por
+        mes y es la aplicación la que elige qué tablas consultar. En PostgreSQL la variante
+        es una tabla `PARTITION BY RANGE (fecha)` y la poda la hace el planificador.
+        """)
+    
+    if ejecutar:
+        barra = st.progress(0.0)
+        try:
+            resultado = ejecutar_laboratorio(
+                motor=motor, escala=escala, repeticiones=int(repeticiones),
+                indice_fecha=indice_fecha, config_pg=config_postgres(),
+                al_progresar=lambda fraccion, mensaje: barra.progress(fraccion, text=mensaje)
+            )
+        except ImportError:
+            st.error("psycopg2 no está instalado: `pip install psycopg2-binary`")
+            return
+        except Exception as e:
+            st.error(f"Error durante el laboratorio: {e}")
+            return
+        guardar_resultado("laboratorio_particiones", resultado)
+    
+    resultado = obtener_resultado("laboratorio_particiones")
+    if resultado is None:
+        return
+    
+    st.markdown("### Resultados")
+    st.caption(
+        f"{resultado['motor']} · {resultado['filas']:,} inscripciones en {resultado['particiones']} "
+        f"particiones mensuales · índice en fecha: {'sí' if resultado['indice_fecha'] else 'no'} · "
+        f"carga {resultado['carga_s']} s"
+    )
+    
+    operaciones = {(op['operacion'], op['variante']): op for op in resultado['operaciones']}
+    borrado_plano = operaciones[('borrar_antes_corte', 'plana')]
+    borrado_particionado = operaciones[('borrar_antes_corte', 'particionada')]
+    drop = operaciones[('drop_particiones', 'particionada')]
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("DELETE en tabla plana (p50)", f"{borrado_plano['p50_ms']} ms")
+    col2.metric(
+        "DELETE en particionada (p50)", f"{borrado_particionado['p50_ms']} ms",
+        delta=f"{borrado_particionado['p50_ms'] - borrado_plano['p50_ms']:.1f} ms", delta_color="inverse"
+    )
+    col3.metric(
+        "DROP de particiones (p50)", f"{drop['p50_ms']} ms",
+        delta=f"{drop['p50_ms'] - borrado_plano['p50_ms']:.1f} ms", delta_color="inverse"
+    )
+    
+    st.dataframe({
+        "Operación": [NOMBRES_OPERACION[op['operacion']] for op in resultado['operaciones']],
+        "Variante": [op['variante'] for op in resultado['operaciones']],
+        "Particiones leídas": [
+            f"{op['particiones_leidas']} de {resultado['particiones']}"
+            if op['particiones_leidas'] is not None else "tabla completa"
+            for op in resultado['operaciones']
+        ],
+        "Filas (COUNT)": [op['total'] for op in resultado['operaciones']],
+        "p50 (ms)": [op['p50_ms'] for op in resultado['operaciones']],
+        "p95 (ms)": [op['p95_ms'] for op in resultado['operaciones']]
+    }, width="stretch")
+    
+    st.markdown("### Planes de ejecución")
+    
+    for op in resultado['operaciones']:
+        with st.expander(f"{NOMBRES_OPERACION[op['operacion']]} · {op['variante']}"):
+            st.code(op['sql'], language='sql')
+            st.code("\n".join(op['plan']), language='text')
+    
+    st.markdown("### Borrar particiones en lugar de filas")
+    
+    st.markdown("""
+    Un `DELETE` masivo recorre y marca cada fila, genera registro de transacciones
+    y deja espacio muerto que luego hay que recuperar (`VACUUM`). Si el corte coincide
+    con los límites de las particiones, eliminar los meses completos es solo quitar
+    archivos, y únicamente el mes del corte necesita un `DELETE`:
+    """)
+    st.code(sql_drop_particiones(), language='sql')
+    st.caption("""
+    En PostgreSQL también se puede usar `ALTER TABLE inscripcion_part DETACH PARTITION ...`
+    para sacar el mes de la tabla y archivarlo antes de borrarlo.
+    """)
@@ -0,0 +1,91 @@
+import streamlit as st
+
+from contenido import RETOS
+from editor_sql import (
+    etiquetar_consulta, mostrar_asistente_nombres, registrar_ddl_sesion, validar_sintaxis_sql
+)
+from estado import bit_activo, marcar_bit
+from similitud import registrar_entrega
+
+
+def vista_practica_autonoma():
+    st.markdown("## Práctica Autónoma (Sandbox)")
+    
+    st.markdown("""
+    Practica libremente con estos retos. Haz clic en los botones para cargar 
+    snippets de código que puedes modificar y experimentar.
+    """)
+    
+    retos = RETOS
+    
+    
+    if 'codigo_sandbox' not in st.session_state:
+        st.session_state.codigo_sandbox = "-- Escribe tu código SQL aquí\n"
+    
+    st.markdown("### Editor SQL Sandbox")
+    
+    
+    st.markdown("**Retos rápidos - Haz clic para cargar el código:**")
+    
+    cols = st.columns(3)
+    for i, reto in enumerate(retos):
+        with cols[i % 3]:
+            if st.button(reto['titulo'], key=f"reto_{i}"):
+                st.session_state.codigo_sandbox = reto['snippet']
+                st.rerun()
+            
+            st.session_state.ejercicios_autonomos = marcar_bit(
+                st.session_state.ejercicios_autonomos, i,
+                st.checkbox(
+                    f"✓ Completado",
+                    key=f"autonomo_{i}",
+                    value=bit_activo(st.session_state.ejercicios_autonomos, i)
+                )
+            )
+    
+    # Editor
+    codigo = st.text_area(
+        "Código SQL:",
+        value=st.session_state.codigo_sandbox,
+        height=200,
+        key="sandbox_editor"
+    )
+    st.session_state.codigo_sandbox = codigo
+    mostrar_asistente_nombres(codigo)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("Validar sintaxis"):
+            valido, mensaje = validar_sintaxis_sql(codigo)
+            if valido:
+                st.success(mensaje)
+                registrar_entrega("sandbox", codigo, referencias=[r['snippet'] for r in retos])
+                for tabla, columnas in registrar_ddl_sesion(codigo).items():
+                    st.caption(f"Catálogo actualizado: {tabla} ({', '.join(c for c, _ in columnas)})")
+            else:
+                st.warning(mensaje)
+    
+    with col2:
+        if st.button("Limpiar editor"):
+            st.session_state.codigo_sandbox = "-- Escribe tu código SQL aquí\n"
+            st.rerun()
+    
+    with col3:
+        if st.button("Copiar al portapapeles"):
+            st.code(etiquetar_consulta(codigo, "sandbox"), language='sql')
+            st.info("Código listo para copiar con el botón de la esquina del bloque")
+    
+    # Descripción de retos expandible
+    with st.expander("Ver descripción detallada de los retos"):
+        for reto in retos:
+            st.markdown(f"**{reto['titulo']}**: {reto['descripcion']}")
+            st.code(reto['snippet'], language='sql')
+    
+    if st.session_state.modo_docente:
+        st.markdown("""
+        <div class="solucion-card">
+        <strong>Nota docente:</strong> Los estudiantes pueden experimentar libremente aquí. 
+        Considere revisar sus intentos y proporcionar retroalimentación personalizada.
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,111 @@
+import streamlit as st
+
+from estadisticas import (
+    INTERVALO_ESTADISTICAS_S, agrupar_estadisticas, calcular_deltas,
+    leer_estadisticas_pg, linea_base_estadisticas
+)
+from memoria import MB, gestor_memoria
+
+
+def vista_rendimiento():
+    st.markdown("## Rendimiento por Ejercicio (Modo Docente)")
+    
+    mostrar_memoria_sesiones()
+    
+    st.markdown("### Consultas por ejercicio")
+    
+    st.markdown(f"""
+    Estadísticas de `pg_stat_statements` para las consultas etiquetadas con
+    `/* taller:<ejercicio> alumno:<nombre> */`. Los contadores se leen como mucho
+    cada {INTERVALO_ESTADISTICAS_S} segundos y se muestran como diferencia respecto
+    al inicio del laboratorio. El ejercicio sale de la etiqueta; el alumno, del rol
+    de base de datos con que ejecutó la consulta.
+    """)
+    
+    st.info("""
+    **Requisitos:** extensión `pg_stat_statements` cargada en `shared_preload_libraries`
+    y creada en la base de datos (`CREATE EXTENSION pg_stat_statements;`), y un rol
+    propio por alumno: pg_stat_statements separa las consultas por rol, no por comentario.
+    """)
+    
+    try:
+        filas = leer_estadisticas_pg(
+            st.session_state.get('db_host', 'localhost'),
+            st.session_state.get('db_puerto', '5432'),
+            st.session_state.get('db_nombre', 'universidad'),
+            st.session_state.get('db_usuario', 'postgres'),
+            st.session_state.get('db_password', '')
+        )
+    except ImportError:
+        st.error("psycopg2 no está instalado: `pip install psycopg2-binary`")
+        return
+    except Exception as e:
+        st.error(f"No se pudieron leer las estadísticas: {e}")
+        return
+    
+    linea_base = linea_base_estadisticas()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("Marcar inicio del laboratorio"):
+            linea_base.clear()
+            linea_base.update({(f['queryid'], f['userid']): f for f in filas})
+            st.rerun()
+    
+    with col2:
+        if st.button("Actualizar ahora"):
+            leer_estadisticas_pg.clear()
+            st.rerun()
+    
+    deltas = calcular_deltas(filas, linea_base)
+    if not deltas:
+        st.info("Aún no hay consultas etiquetadas desde el inicio del laboratorio.")
+        return
+    
+    por_ejercicio = agrupar_estadisticas(deltas)
+    
+    st.metric(
+        "Ejercicio con más carga",
+        por_ejercicio["Ejercicio"][0],
+        f"{por_ejercicio['Llamadas'][0]} llamadas"
+    )
+    
+    tab1, tab2 = st.tabs(["Por ejercicio", "Por alumno (rol)"])
+    
+    with tab1:
+        st.dataframe(por_ejercicio, width="stretch")
+    
+    with tab2:
+        st.dataframe(agrupar_estadisticas(deltas, por_alumno=True), width="stretch")
+    
+    st.caption("El máximo es acumulado desde el último reset de pg_stat_statements.")
+
+
+def mostrar_memoria_sesiones():
+    st.markdown("### Memoria por sesión")
+    
+    gestor = gestor_memoria()
+    resumen = gestor.resumen()
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Sesiones activas", len(resumen))
+    with col2:
+        st.metric(
+            "Resultados en memoria",
+            f"{gestor.bytes_memoria / MB:.1f} MB",
+            f"presupuesto {gestor.presupuesto_global / MB:.0f} MB",
+            delta_color="off"
+        )
+    with col3:
+        st.metric("Resultados en disco", f"{gestor.bytes_disco / MB:.1f} MB")
+    
+    if resumen:
+        st.dataframe({
+            "Sesión": [f['sesion'] for f in resumen],
+            "Estado (KB)": [round(f['estado'] / 1024, 1) for f in resumen],
+            "Resultados en memoria (KB)": [round(f['memoria'] / 1024, 1) for f in resumen],
+            "Resultados en disco (KB)": [round(f['disco'] / 1024, 1) for f in resumen],
+            "Entradas": [f['entradas'] for f in resumen]
+        }, width="stretch")
@@ -0,0 +1,46 @@
+import streamlit as st
+
+from similitud import UMBRAL_SIMILITUD, motor_similitud, purgar_inactivas
+
+
+def vista_similitud():
+    st.markdown("## Similitud de Entregas (Modo Docente)")
+    
+    st.markdown(f"""
+    Pares de entregas del mismo ejercicio con similitud estimada de al menos
+    {UMBRAL_SIMILITUD:.0%}. Se comparan las consultas normalizadas (sin literales,
+    alias ni espacios), por lo que cambiar valores o nombres de alias no oculta una copia.
+    Una entrega se registra cada vez que el alumno valida su código con éxito.
+    """)
+    
+    purgar_inactivas(st.session_state.id_sesion)
+    motor = motor_similitud()
+    pares = motor.pares_similares()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Entregas registradas", len(motor.entregas))
+    with col2:
+        st.metric("Pares similares", len(pares))
+    
+    if not pares:
+        st.info("No se han detectado entregas similares.")
+        return
+    
+    st.dataframe({
+        "Ejercicio": [p[0] for p in pares],
+        "Alumno A": [p[1] for p in pares],
+        "Alumno B": [p[2] for p in pares],
+        "Similitud": [f"{p[3]:.0%}" for p in pares]
+    }, width="stretch")
+    
+    st.markdown("### Detalle")
+    for ejercicio, alumno_a, alumno_b, similitud, codigo_a, codigo_b in pares[:20]:
+        with st.expander(f"{ejercicio}: {alumno_a} ↔ {alumno_b} ({similitud:.0%})"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.caption(alumno_a)
+                st.code(codigo_a, language='sql')
+            with col2:
+                st.caption(alumno_b)
+                st.code(codigo_b, language='sql')